@@ -0,0 +1,68 @@
+"""CommonEVMParallelのワーカー数ごとの処理時間計測
+
+使い方:
+    python benchmarks/bench_evm_parallel.py [チケット数] [最大ワーカー数]
+"""
+from datetime import date, timedelta
+import os
+import random
+import sys
+import time
+import numpy as np
+from bteam_utils import CommonCalendar, CommonEVM, CommonEVMParallel
+from bteam_utils.common_evm import CommonEVMInput
+
+def create_inputs(count:int) -> list:
+    """計測用のEVM入力データ作成
+
+    Args:
+        count (int): チケット数
+    Returns:
+        list: CommonEVMInputのリスト
+    """
+    random.seed(0)
+    inputs = []
+    for _ in range(count):
+        start_date = date(2024, 1, 1) + timedelta(days=random.randint(0, 365))
+        inputs.append(CommonEVMInput(
+            status_ongoing=True,
+            start_date=start_date,
+            due_date=start_date + timedelta(days=random.randint(0, 90)),
+            done_ratio=random.choice([0, 10, 30, 50, 80, 100]),
+            estimated_hours=random.randint(1, 80) / 2,
+            spent_hours=random.randint(0, 80) / 2))
+    return inputs
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    calendar = CommonCalendar.shared()
+    inputs = create_inputs(count)
+    as_of_date = date(2024, 9, 30)
+
+    # 基準値(1件ずつのCommonEVM計算、先頭1万件から全件を推定)
+    sample = inputs[:10000]
+    started = time.perf_counter()
+    for input_data in sample:
+        CommonEVM.evaluate(input_data, as_of_date, calendar)
+    per_ticket = (time.perf_counter() - started) / len(sample)
+    print(f"tickets={count} cpu={os.cpu_count()}")
+    print(f"per-ticket evaluate (estimated): {per_ticket * count:8.3f} s")
+
+    # ワーカー数ごとの計測(プール起動時間を除くため1回目は捨てる)
+    expected = None
+    workers = 1
+    while workers <= max_workers:
+        with CommonEVMParallel(calendar, max_workers=workers) as parallel:
+            parallel.evaluate(inputs[:workers * 20000], as_of_date)
+            started = time.perf_counter()
+            result = parallel.evaluate(inputs, as_of_date)
+            elapsed = time.perf_counter() - started
+        if expected is None:
+            expected = result
+        assert np.array_equal(result, expected)
+        print(f"workers={workers:2}: {elapsed:8.3f} s")
+        workers *= 2
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""CommonXML.save_xmlの逐次書き込みとminidom整形の比較(処理時間・最大メモリ使用量)
+
+使い方:
+    python benchmarks/bench_xml_writer.py [チケット数] [列数]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as Et
+from bteam_utils import CommonXML
+
+def create_tree(count:int, columns:int) -> Et.Element:
+    """計測用のチケットXML作成
+
+    Args:
+        count (int): チケット数
+        columns (int): 列数
+    Returns:
+        Et.Element: rootのElement
+    """
+    root = Et.Element('issues')
+    header = Et.SubElement(root, 'header')
+    for column in range(columns):
+        Et.SubElement(header, f'c{column}', {'name': f'列{column}'})
+    for ticket in range(count):
+        body = Et.SubElement(root, 'issue', {'id': str(ticket)})
+        for column in range(columns):
+            Et.SubElement(body, f'c{column}').text = f'値 "{ticket}" & <{column}>' if column % 3 else None
+    return root
+
+def measure(func) -> tuple:
+    """処理時間と最大メモリ使用量の計測
+
+    Args:
+        func (callable): 計測対象
+    Returns:
+        tuple: (処理時間(秒), 最大メモリ使用量(MB))
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    root = create_tree(count, columns)
+    xml = CommonXML()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        minidom_path = os.path.join(temp_dir, 'minidom.xml')
+        writer_path = os.path.join(temp_dir, 'writer.xml')
+
+        def save_minidom() -> None:
+            with open(minidom_path, 'w', encoding='utf-8') as f:
+                f.write(xml.pretty_tree(root))
+
+        minidom_time, minidom_peak = measure(save_minidom)
+        writer_time, writer_peak = measure(lambda: xml.save_xml(root, writer_path))
+        with open(minidom_path, 'rb') as f1, open(writer_path, 'rb') as f2:
+            assert f1.read() == f2.read()
+        print(f"tickets={count} columns={columns} size={os.path.getsize(writer_path) / 1024 / 1024:.1f} MB")
+    print(f"minidom: {minidom_time:8.3f} s  peak {minidom_peak:8.1f} MB")
+    print(f"writer : {writer_time:8.3f} s  peak {writer_peak:8.1f} MB")
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,15 @@
 from .common_xml import CommonXML
 from .common_calendar import CommonCalendar
+from .common_calendar import CommonCalendarMemo
 from .common_evm import CommonEVM
+from .common_evm_rollup import CommonEVMRollup
+from .common_evm_parallel import CommonEVMParallel
+from .common_evm_cache import CommonEVMCache
+from .common_evm_pipeline import CommonEVMPipeline
+from .common_evm_snapshot import CommonEVMSnapshotStore
 from .common_progress import CommonProgress
+from .common_progress import CommonProgressAggregator
+from .common_progress import CommonProgressCounter
 from .common_prohibit_replacer import AbstractProhibitReplacer
 from .common_prohibit_replacer import BaseProhibitReplacer
 from .common_prohibit_replacer import PathProhibitReplacer
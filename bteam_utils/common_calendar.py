@@ -1,31 +1,157 @@
-from datetime import datetime, date
+from datetime import datetime, date, time
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+import numpy as np
 import pandas as pd
 import holidays
 
+_EPOCH_ORDINAL = date(1970,1,1).toordinal() # datetime64[D]の基準日(序数)
+
 class CommonCalendar:
     _buzzday:pd.offsets.CustomBusinessDay = None # 営業日リスト
+    _holidays:np.ndarray = None # 休日リスト(datetime64[D])
+
+    # 営業日インデックス
+    # (開始日(1970/1/1からの日数), 累積営業日数配列, 営業日位置配列)の組
+    # 累積営業日数配列[i]は開始日からi日目の前日までの営業日数
+    # 営業日位置配列[k]はk番目の営業日の開始日からの日数
+    _index:tuple = None
+    _index_lock:threading.Lock = None # インデックス拡張用ロック
+    _fingerprint:str = None # 休日セットの識別子
 
     LIMIT_DATE = date(2020,1,1) # 検索制限日付
+    HORIZON_YEARS = 3 # インデックス事前計算年数
 
-    def __init__(self, holiday_list:list=None) -> None:
+    # 共有カレンダー登録簿(プロセス内で休日セットごとに1インスタンス)
+    _shared_calendars:dict = {} # 休日セットキー -> CommonCalendar
+    _shared_lock:threading.Lock = threading.Lock() # 登録簿用ロック
+    _shared_hits:int = 0 # 登録簿ヒット数
+    _shared_misses:int = 0 # 登録簿ミス数
+
+    def __init__(self, holiday_list:list=None, country:str='JP', cache_dir:str=None) -> None:
         """コンストラクタ
         
         Args:
             holiday_list (list): 休日リスト
+            country (str): 祝日の国コード(休日リスト指定なしの場合に使用)
+            cache_dir (str): 休日テーブルのキャッシュ保存先(指定なしの場合はキャッシュしない)
         """
-        if holiday_list is not None:
-            # カスタム休日リスト設定
-            self._buzzday = pd.offsets.CustomBusinessDay(holidays=holiday_list)
-        else:
-            # 日本の祝日設定
-            start_year = self.LIMIT_DATE.year
-            years = range(start_year, datetime.now().year + 3)
-            holiday_list = holidays.country_holidays('JP', years=years).keys()
-            self._buzzday = pd.offsets.CustomBusinessDay(holidays=list(holiday_list))
+        # 休日リスト設定
+        self._holidays = self._load_holidays(holiday_list, country, cache_dir)
+        self._buzzday = pd.offsets.CustomBusinessDay(holidays=self._holidays)
+        # 営業日インデックス構築(LIMIT_DATE～HORIZON_YEARS年後の年末)
+        self._index_lock = threading.Lock()
+        self._build_default_index()
 
     def __del__(self) -> None:
         pass
 
+    def __getstate__(self) -> dict:
+        # ロックと再構築可能な営業日リスト・インデックスは保存しない
+        state = self.__dict__.copy()
+        state['_holidays'] = np.array(self._holidays, dtype='datetime64[D]')
+        for name in ('_buzzday', '_index', '_index_lock'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state:dict) -> None:
+        self.__dict__.update(state)
+        self._buzzday = pd.offsets.CustomBusinessDay(holidays=self._holidays)
+        self._index_lock = threading.Lock()
+        self._build_default_index()
+
+    @classmethod
+    def shared(cls, holiday_list:list=None, country:str='JP', cache_dir:str=None) -> 'CommonCalendar':
+        """ 共有カレンダー取得
+
+        同じ休日セットのカレンダーはプロセス内で1インスタンスを共有する。
+        共有インスタンスはスレッド間で共有されるため、利用側で変更しないこと。
+
+        Args:
+            holiday_list (list): 休日リスト
+            country (str): 祝日の国コード(休日リスト指定なしの場合に使用)
+            cache_dir (str): 休日テーブルのキャッシュ保存先
+        Returns:
+            CommonCalendar: 共有カレンダー
+        """
+        if holiday_list is None:
+            years = cls._holiday_years()
+            key = (cls, 'country', country, years.start, years.stop)
+        else:
+            holiday_list = list(holiday_list)
+            key = (cls, 'custom', cls._to_datetime64(holiday_list).tobytes())
+        with cls._shared_lock:
+            calendar = cls._shared_calendars.get(key)
+            if calendar is not None:
+                CommonCalendar._shared_hits += 1
+                return calendar
+            CommonCalendar._shared_misses += 1
+            calendar = cls(holiday_list=holiday_list, country=country, cache_dir=cache_dir)
+            cls._shared_calendars[key] = calendar
+            return calendar
+
+    @classmethod
+    def shared_stats(cls) -> dict:
+        """ 共有カレンダー統計取得
+
+        Returns:
+            dict: 統計情報
+                calendars (int): 登録カレンダー数
+                hits (int): ヒット数
+                misses (int): ミス数
+                nbytes (int): 休日テーブル・営業日インデックスの使用メモリ(バイト)
+        """
+        with cls._shared_lock:
+            calendars = list(cls._shared_calendars.values())
+            hits, misses = CommonCalendar._shared_hits, CommonCalendar._shared_misses
+        return {
+            'calendars': len(calendars),
+            'hits': hits,
+            'misses': misses,
+            'nbytes': sum(calendar.nbytes() for calendar in calendars),
+        }
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        """ 共有カレンダー登録簿の初期化
+        """
+        with cls._shared_lock:
+            cls._shared_calendars.clear()
+            CommonCalendar._shared_hits = 0
+            CommonCalendar._shared_misses = 0
+
+    def get_holidays(self) -> np.ndarray:
+        """ 休日リスト取得
+
+        Returns:
+            np.ndarray: 休日リスト(datetime64[D]、昇順)
+        """
+        return np.array(self._holidays, dtype='datetime64[D]')
+
+    def get_fingerprint(self) -> str:
+        """ 休日セットの識別子取得
+
+        同じ休日セットのカレンダーは、プロセスをまたいでも同じ識別子となる。
+
+        Returns:
+            str: 休日セットの識別子(16進文字列)
+        """
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha256(self.get_holidays().astype('int64').tobytes()).hexdigest()[:16]
+        return self._fingerprint
+
+    def nbytes(self) -> int:
+        """ 使用メモリ取得
+
+        Returns:
+            int: 休日テーブル・営業日インデックスの使用メモリ(バイト)
+        """
+        _, cum, buzzdays = self._index
+        return self._holidays.nbytes + cum.nbytes + buzzdays.nbytes
+
     def is_holiday(self, target_date:date) -> bool:
         """ 休日判定
 
@@ -34,7 +160,9 @@ class CommonCalendar:
         Returns:
             bool: True=休日, Flase=営業日
         """
-        return not self._buzzday.is_on_offset(target_date)
+        target = self._to_ordinal(target_date)
+        base, cum, _ = self._get_scalar_index(target, target)
+        return bool(cum[target - base + 1] == cum[target - base])
 
     def get_recent_weekday(self, target_date:date) -> date:
         """ 直近営業日を取得
@@ -44,7 +172,13 @@ class CommonCalendar:
         Returns:
             datetime.date: 直近営業日の日付
         """
-        return self._buzzday.rollback(target_date).date()
+        target = self._to_ordinal(target_date)
+        base, cum, buzzdays = self._get_scalar_index(target, target)
+        count = int(cum[target - base + 1])
+        if count == 0:
+            # 対象日以前の営業日がインデックスに無い場合は配列版で過去方向に拡張する
+            return date.fromordinal(int(self._rollback_ordinal(target)) + _EPOCH_ORDINAL)
+        return date.fromordinal(base + int(buzzdays[count - 1]) + _EPOCH_ORDINAL)
 
     def get_firstday_week(self, target_date:date) -> date:
         """ 週初日取得
@@ -54,7 +188,8 @@ class CommonCalendar:
         Returns:
             datetime.date: 週初日の日付
         """
-        return pd.Timestamp(target_date).to_period('W').start_time.date()
+        start, _ = self._period_ordinal(self._to_ordinal(target_date), 'W')
+        return date.fromordinal(int(start) + _EPOCH_ORDINAL)
 
     def get_firstday_month(self, target_date:date) -> date:
         """ 月初日取得
@@ -64,11 +199,16 @@ class CommonCalendar:
         Returns:
             datetime.date: 月初日の日付
         """
-        return pd.Timestamp(target_date).to_period('M').start_time.date()
+        return self._to_date(target_date).replace(day=1)
 
     def count_businessday(self, start_date:date, end_date:date) -> int:
         """ 営業日数取得
 
+        開始日・終了日を含む期間の営業日数を累積営業日数インデックスから求める。
+        開始日が終了日より後の場合は0を返す。
+        時刻付きの場合は従来のpd.date_range()と同じく開始日時から1日刻みで数えるため、
+        開始時刻が終了時刻より後であれば終了日は含めない。
+
         Args:
             start_date (datetime.date): 開始日
             end_date (datetime.date): 終了日
@@ -76,5 +216,607 @@ class CommonCalendar:
         Returns:
             int: 営業日数
         """
-        return len(pd.date_range(start=start_date, end=end_date, freq=self._buzzday))
-    
\ No newline at end of file
+        end = self._to_ordinal(end_date)
+        if type(start_date) is not date and self._to_time(start_date) > self._to_time(end_date):
+            end -= 1
+        return self._count_scalar(self._to_ordinal(start_date), end)
+
+    def is_holiday_many(self, target_dates) -> np.ndarray:
+        """ 休日判定(一括)
+
+        Args:
+            target_dates (array-like): 判定対象日の配列(np.ndarray, pd.Series, list)
+        Returns:
+            np.ndarray: 休日判定結果(bool配列)。NaT/NoneはFalse(営業日扱い)
+        """
+        target, valid = self._to_ordinals(target_dates)
+        result = np.zeros(target.shape, dtype=bool)
+        if valid.any():
+            result[valid] = ~self._is_buzzday_ordinal(target[valid])
+        return result
+
+    def get_recent_weekday_many(self, target_dates) -> np.ndarray:
+        """ 直近営業日を取得(一括)
+
+        Args:
+            target_dates (array-like): 判定対象日の配列(np.ndarray, pd.Series, list)
+        Returns:
+            np.ndarray: 直近営業日の配列(datetime64[D])。NaT/NoneはNaT
+        """
+        target, valid = self._to_ordinals(target_dates)
+        result = np.full(target.shape, np.datetime64('NaT', 'D'), dtype='datetime64[D]')
+        if valid.any():
+            result[valid] = self._rollback_ordinal(target[valid]).astype('datetime64[D]')
+        return result
+
+    def count_businessday_many(self, start_dates, end_dates) -> np.ndarray:
+        """ 営業日数取得(一括)
+
+        時刻は切り捨て、開始日・終了日を含む日付単位で数える。
+
+        Args:
+            start_dates (array-like): 開始日の配列(np.ndarray, pd.Series, list)
+            end_dates (array-like): 終了日の配列(np.ndarray, pd.Series, list)
+        Returns:
+            np.ndarray: 営業日数の配列(int64)。開始日・終了日のいずれかがNaT/Noneの場合は0
+        """
+        start, start_valid = self._to_ordinals(start_dates)
+        end, end_valid = self._to_ordinals(end_dates)
+        valid = start_valid & end_valid
+        result = np.zeros(np.broadcast(start, end).shape, dtype='int64')
+        if valid.any():
+            start, end = np.broadcast_arrays(start, end)
+            result[valid] = self._count_ordinal(start[valid], end[valid])
+        return result
+
+    def add_businessdays(self, target_date:date, days:int) -> date:
+        """ 営業日加算
+
+        pandasの営業日オフセット加算(target_date + days * CustomBusinessDay)と同じ結果を返す。
+        対象日が休日の場合、正の加算は直前営業日から、0以下の加算は翌営業日から数える。
+
+        Args:
+            target_date (datetime.date): 基準日
+            days (int): 加算営業日数(負数の場合は減算)
+        Returns:
+            datetime.date: 加算後の日付
+        """
+        target, days = self._to_ordinal(target_date), int(days)
+        base, cum, buzzdays = self._get_scalar_index(target, target)
+        count = int(cum[target - base + 1])
+        # 休日からの0以下の加算は翌営業日を起点とする
+        position = count - 1 + days + (1 if days <= 0 and count == cum[target - base] else 0)
+        if 0 <= position < len(buzzdays):
+            return date.fromordinal(base + int(buzzdays[position]) + _EPOCH_ORDINAL)
+        # インデックス範囲外となる場合は配列版で拡張する
+        result = self._add_ordinal(target, days)
+        return date.fromordinal(int(result) + _EPOCH_ORDINAL)
+
+    def nth_businessday(self, target_date:date, nth:int, freq:str='M') -> date:
+        """ 期間内のn番目の営業日取得
+
+        Args:
+            target_date (datetime.date): 期間内の任意の日
+            nth (int): 営業日の番号(1始まり、負数の場合は期間末尾から数える)
+            freq (str): 期間種別('W':週(月曜始まり), 'M':月)
+        Returns:
+            datetime.date: n番目の営業日(該当なしの場合はNone)
+        """
+        result, valid = self._nth_ordinal(self._to_ordinal(target_date), int(nth), freq)
+        return date.fromordinal(int(result) + _EPOCH_ORDINAL) if valid else None
+
+    def businessdays_in_period(self, target_date:date, freq:str='M') -> int:
+        """ 期間内の営業日数取得
+
+        Args:
+            target_date (datetime.date): 期間内の任意の日
+            freq (str): 期間種別('W':週(月曜始まり), 'M':月)
+        Returns:
+            int: 期間内の営業日数
+        """
+        start, end = self._period_ordinal(self._to_ordinal(target_date), freq)
+        return self._count_scalar(int(start), int(end))
+
+    def get_firstday_week_many(self, target_dates) -> np.ndarray:
+        """ 週初日取得(一括)
+
+        Args:
+            target_dates (array-like): 判定対象日の配列(np.ndarray, pd.Series, list)
+        Returns:
+            np.ndarray: 週初日の配列(datetime64[D])。NaT/NoneはNaT
+        """
+        target, valid = self._to_ordinals(target_dates)
+        start, _ = self._period_ordinal(target, 'W')
+        return np.where(valid, start, np.datetime64('NaT', 'D').astype('int64')).astype('datetime64[D]')
+
+    def get_firstday_month_many(self, target_dates) -> np.ndarray:
+        """ 月初日取得(一括)
+
+        Args:
+            target_dates (array-like): 判定対象日の配列(np.ndarray, pd.Series, list)
+        Returns:
+            np.ndarray: 月初日の配列(datetime64[D])。NaT/NoneはNaT
+        """
+        target, valid = self._to_ordinals(target_dates)
+        start, _ = self._period_ordinal(target, 'M')
+        return np.where(valid, start, np.datetime64('NaT', 'D').astype('int64')).astype('datetime64[D]')
+
+    def add_businessdays_many(self, target_dates, days) -> np.ndarray:
+        """ 営業日加算(一括)
+
+        Args:
+            target_dates (array-like): 基準日の配列(np.ndarray, pd.Series, list)
+            days (int | array-like): 加算営業日数(基準日の配列と同じ長さの配列も可)
+        Returns:
+            np.ndarray: 加算後の日付の配列(datetime64[D])。NaT/NoneはNaT
+        """
+        target, valid = self._to_ordinals(target_dates)
+        days = np.asarray(days, dtype='int64')
+        target, days = np.broadcast_arrays(target, days)
+        valid = np.broadcast_to(valid, target.shape)
+        result = np.full(target.shape, np.datetime64('NaT', 'D'), dtype='datetime64[D]')
+        if valid.any():
+            result[valid] = self._add_ordinal(target[valid], days[valid]).astype('datetime64[D]')
+        return result
+
+    def nth_businessday_many(self, target_dates, nth, freq:str='M') -> np.ndarray:
+        """ 期間内のn番目の営業日取得(一括)
+
+        Args:
+            target_dates (array-like): 期間内の任意の日の配列(np.ndarray, pd.Series, list)
+            nth (int | array-like): 営業日の番号(1始まり、負数の場合は期間末尾から数える)
+            freq (str): 期間種別('W':週(月曜始まり), 'M':月)
+        Returns:
+            np.ndarray: n番目の営業日の配列(datetime64[D])。該当なし・NaT/NoneはNaT
+        """
+        target, valid = self._to_ordinals(target_dates)
+        nth = np.asarray(nth, dtype='int64')
+        target, nth = np.broadcast_arrays(target, nth)
+        valid = np.broadcast_to(valid, target.shape)
+        result = np.full(target.shape, np.datetime64('NaT', 'D'), dtype='datetime64[D]')
+        if valid.any():
+            found, found_valid = self._nth_ordinal(target[valid], nth[valid], freq)
+            result[valid] = np.where(found_valid, found, np.datetime64('NaT', 'D').astype('int64')).astype('datetime64[D]')
+        return result
+
+    def businessdays_in_period_many(self, target_dates, freq:str='M') -> np.ndarray:
+        """ 期間内の営業日数取得(一括)
+
+        Args:
+            target_dates (array-like): 期間内の任意の日の配列(np.ndarray, pd.Series, list)
+            freq (str): 期間種別('W':週(月曜始まり), 'M':月)
+        Returns:
+            np.ndarray: 期間内の営業日数の配列(int64)。NaT/Noneは0
+        """
+        target, valid = self._to_ordinals(target_dates)
+        result = np.zeros(target.shape, dtype='int64')
+        if valid.any():
+            start, end = self._period_ordinal(target[valid], freq)
+            result[valid] = self._count_ordinal(start, end)
+        return result
+
+    #
+    # protectedメソッド
+    #
+    def _to_date(self, target_date:date) -> date:
+        """ 日付への変換
+
+        Args:
+            target_date (datetime.date): 変換対象日(datetime, pd.Timestamp, 文字列も可)
+        Returns:
+            datetime.date: 日付
+        """
+        if isinstance(target_date, datetime):
+            # datetime/pd.Timestampは日付部のみ使用
+            return target_date.date()
+        if isinstance(target_date, date):
+            return target_date
+        # 文字列等はpandasで解釈
+        return pd.Timestamp(target_date).date()
+
+    def _to_time(self, target_date:date) -> time:
+        """ 時刻部の取得
+
+        Args:
+            target_date (datetime.date): 対象日(datetime, pd.Timestamp, 文字列も可)
+        Returns:
+            datetime.time: 時刻(dateの場合は0:00)
+        """
+        if isinstance(target_date, datetime):
+            return target_date.time()
+        if isinstance(target_date, date):
+            return time()
+        return pd.Timestamp(target_date).time()
+
+    def _to_ordinal(self, target_date:date) -> int:
+        """ 日付を1970/1/1からの日数に変換
+
+        Args:
+            target_date (datetime.date): 変換対象日
+        Returns:
+            int: 1970/1/1からの日数
+        """
+        return self._to_date(target_date).toordinal() - _EPOCH_ORDINAL
+
+    def _to_ordinals(self, target_dates) -> tuple:
+        """ 日付配列を1970/1/1からの日数の配列に変換
+
+        datetime64以外の配列は重複を除いた値のみ変換し、同じ日付の変換を繰り返さない。
+        タイムゾーン付きの日時は_to_date()と同じく現地時刻の日付部を使用する。
+
+        Args:
+            target_dates (array-like): 変換対象日の配列
+        Returns:
+            tuple: (1970/1/1からの日数(int64配列), 有効値マスク(bool配列))
+                   NaT/Noneの要素は日数0、マスクFalseとする
+        """
+        if isinstance(target_dates, (pd.Series, pd.Index)):
+            if isinstance(target_dates.dtype, pd.DatetimeTZDtype):
+                # タイムゾーンを外して現地時刻のまま扱う(UTCに変換しない)
+                if isinstance(target_dates, pd.Series):
+                    target_dates = target_dates.dt.tz_localize(None)
+                else:
+                    target_dates = target_dates.tz_localize(None)
+            target_dates = target_dates.to_numpy()
+        values = np.asarray(target_dates)
+        if values.dtype.kind != 'M':
+            # 重複を除いた値を変換し、コード経由で元の並びに展開する
+            codes, uniques = pd.factorize(values.ravel())
+            uniques = np.asarray(uniques, dtype=object)
+            try:
+                converted = pd.DatetimeIndex(pd.to_datetime(uniques))
+            except (TypeError, ValueError):
+                # タイムゾーンが混在する場合等は要素ごとに変換
+                converted = pd.DatetimeIndex([self._to_date(value) for value in uniques])
+            if converted.tz is not None:
+                converted = converted.tz_localize(None)
+            converted = np.append(converted.values.astype('datetime64[D]'), np.datetime64('NaT', 'D')) # コード-1(欠損値)用
+            values = converted[codes].reshape(values.shape)
+        values = values.astype('datetime64[D]')
+        valid = ~np.isnat(values)
+        ordinals = values.astype('int64')
+        ordinals[~valid] = 0
+        return ordinals, valid
+
+    def _load_holidays(self, holiday_list:list, country:str, cache_dir:str) -> np.ndarray:
+        """ 休日テーブルの取得
+
+        キャッシュ保存先が指定された場合は、国コード・対象年・休日リスト・holidaysの
+        バージョンをキーとした.npyファイル(1970/1/1からの日数)を読み込む。
+        キャッシュが無い場合は休日テーブルを作成して保存する。
+
+        Args:
+            holiday_list (list): 休日リスト
+            country (str): 祝日の国コード
+            cache_dir (str): キャッシュ保存先
+        Returns:
+            np.ndarray: 休日リスト(datetime64[D])
+        """
+        years = self._holiday_years()
+        if holiday_list is not None:
+            holiday_list = list(holiday_list)
+        if cache_dir is None:
+            return self._create_holidays(holiday_list, country, years)
+
+        # キャッシュキー作成
+        if holiday_list is None:
+            source = f"{country}:{years.start}-{years.stop}"
+        else:
+            source = "custom:" + "|".join(str(holiday) for holiday in holiday_list)
+        key = hashlib.sha256(f"{holidays.__version__}|{source}".encode('utf-8')).hexdigest()[:16]
+        name = country if holiday_list is None else 'custom'
+        cache_path = os.path.join(cache_dir, f"holidays_{name}_{key}.npy")
+
+        # キャッシュ読込(メモリマップ)
+        try:
+            return np.load(cache_path, mmap_mode='r').view('datetime64[D]')
+        except (OSError, ValueError):
+            pass
+
+        # キャッシュ作成(一時ファイルに書き込んでから置き換える)
+        table = self._create_holidays(holiday_list, country, years)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, table.astype('int64'))
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # キャッシュ保存に失敗しても計算結果はそのまま使用する
+            pass
+        return table
+
+    @classmethod
+    def _holiday_years(cls) -> range:
+        """ 祝日の対象年取得
+
+        Returns:
+            range: LIMIT_DATEの年～2年後までの対象年
+        """
+        return range(cls.LIMIT_DATE.year, datetime.now().year + 3)
+
+    def _create_holidays(self, holiday_list:list, country:str, years:range) -> np.ndarray:
+        """ 休日テーブルの作成
+
+        Args:
+            holiday_list (list): 休日リスト(Noneの場合は国の祝日)
+            country (str): 祝日の国コード
+            years (range): 祝日の対象年
+        Returns:
+            np.ndarray: 休日リスト(datetime64[D])
+        """
+        if holiday_list is None:
+            # 国の祝日設定
+            holiday_list = holidays.country_holidays(country, years=years).keys()
+        return self._to_datetime64(holiday_list)
+
+    @staticmethod
+    def _to_datetime64(date_list) -> np.ndarray:
+        """ 日付リストをdatetime64[D]配列に変換
+
+        Args:
+            date_list: 日付リスト
+        Returns:
+            np.ndarray: datetime64[D]配列(昇順)
+        """
+        values = pd.to_datetime(list(date_list)).values.astype('datetime64[D]')
+        return np.unique(values)
+
+    def _count_scalar(self, start:int, end:int) -> int:
+        """ 営業日数取得(日数指定、単一日付用)
+
+        Args:
+            start (int): 開始日(1970/1/1からの日数)
+            end (int): 終了日(1970/1/1からの日数)
+        Returns:
+            int: 営業日数(開始日 > 終了日の場合は0)
+        """
+        if start > end:
+            return 0
+        base, cum, _ = self._get_scalar_index(start, end)
+        return int(cum[end - base + 1]) - int(cum[start - base])
+
+    def _get_scalar_index(self, start:int, end:int) -> tuple:
+        """ 指定期間を含む営業日インデックスを取得(単一日付用)
+
+        範囲内の場合はロック・配列演算なしで現在のインデックスを返す。
+
+        Args:
+            start (int): 開始日(1970/1/1からの日数)
+            end (int): 終了日(1970/1/1からの日数)
+        Returns:
+            tuple: (インデックス開始日, 累積営業日数, 営業日位置)
+        """
+        index = self._index
+        base, cum, _ = index
+        if base <= start and end < base + len(cum) - 1:
+            return index
+        return self._get_index(start, end)
+
+    def _count_ordinal(self, start, end):
+        """ 営業日数取得(日数指定)
+
+        Args:
+            start (int | np.ndarray): 開始日(1970/1/1からの日数)
+            end (int | np.ndarray): 終了日(1970/1/1からの日数)
+        Returns:
+            int | np.ndarray: 営業日数
+        """
+        # 開始日 > 終了日の場合でも範囲外参照とならないよう終了日を補正する
+        ordered = start <= end
+        end = np.where(ordered, end, start)
+        base, cum, _ = self._get_index(np.min(start), np.max(end))
+        count = cum[end - base + 1] - cum[start - base]
+        return np.where(ordered, count, 0)
+
+    def _is_buzzday_ordinal(self, target):
+        """ 営業日判定(日数指定)
+
+        Args:
+            target (int | np.ndarray): 判定対象日(1970/1/1からの日数)
+        Returns:
+            bool | np.ndarray: True=営業日, False=休日
+        """
+        base, cum, _ = self._get_index(np.min(target), np.max(target))
+        return cum[target - base + 1] != cum[target - base]
+
+    def _rollback_ordinal(self, target):
+        """ 直近営業日取得(日数指定)
+
+        Args:
+            target (int | np.ndarray): 判定対象日(1970/1/1からの日数)
+        Returns:
+            int | np.ndarray: 直近営業日(1970/1/1からの日数)
+        """
+        start = np.min(target)
+        base, cum, buzzdays = self._get_index(start, np.max(target))
+        # 対象日以前の営業日がインデックスに無い場合は過去方向に拡張する
+        while cum[start - base + 1] == 0:
+            base, cum, buzzdays = self._get_index(base - 1, np.max(target))
+        return base + buzzdays[cum[target - base + 1] - 1]
+
+    def _add_ordinal(self, target, days):
+        """ 営業日加算(日数指定)
+
+        Args:
+            target (int | np.ndarray): 基準日(1970/1/1からの日数)
+            days (int | np.ndarray): 加算営業日数
+        Returns:
+            int | np.ndarray: 加算後の日付(1970/1/1からの日数)
+        """
+        # 加算営業日数に対して十分な範囲を確保し、不足する場合は倍々で拡張する
+        margin = int(np.max(np.abs(days))) * 2 + 14
+        while True:
+            start = np.min(target) - (margin if np.min(days) < 0 else 0)
+            end = np.max(target) + (margin if np.max(days) >= 0 else 0)
+            base, cum, buzzdays = self._get_index(start, end)
+            # 対象日までの営業日数と営業日判定
+            count = cum[target - base + 1]
+            on_offset = count != cum[target - base]
+            # 休日からの0以下の加算は翌営業日を起点とする
+            position = count - 1 + days + (~on_offset & (days <= 0))
+            if np.min(position) >= 0 and np.max(position) < len(buzzdays):
+                return base + buzzdays[position]
+            margin *= 2
+
+    def _nth_ordinal(self, target, nth, freq:str) -> tuple:
+        """ 期間内のn番目の営業日取得(日数指定)
+
+        Args:
+            target (int | np.ndarray): 期間内の任意の日(1970/1/1からの日数)
+            nth (int | np.ndarray): 営業日の番号(1始まり、負数の場合は期間末尾から数える)
+            freq (str): 期間種別('W', 'M')
+        Returns:
+            tuple: (n番目の営業日(1970/1/1からの日数), 該当有無)
+        """
+        start, end = self._period_ordinal(target, freq)
+        base, cum, buzzdays = self._get_index(np.min(start), np.max(end))
+        first = cum[start - base] # 期間開始時点の営業日番号
+        last = cum[end - base + 1] # 期間終了時点の営業日番号(この番号は含まない)
+        position = np.where(nth > 0, first + nth - 1, last + nth)
+        valid = (nth != 0) & (position >= first) & (position < last)
+        # 該当なしの場合も範囲外参照とならないよう補正する
+        position = np.where(valid, position, first)
+        result = base + buzzdays[np.minimum(position, len(buzzdays) - 1)]
+        return result, valid
+
+    def _period_ordinal(self, target, freq:str) -> tuple:
+        """ 対象日を含む期間の取得(日数指定)
+
+        Args:
+            target (int | np.ndarray): 期間内の任意の日(1970/1/1からの日数)
+            freq (str): 期間種別('W':週(月曜始まり), 'M':月)
+        Returns:
+            tuple: (期間開始日, 期間終了日)(1970/1/1からの日数)
+        """
+        match freq:
+            case 'W':
+                # 1970/1/1は木曜日(月曜日からの日数=3)
+                start = target - (target + 3) % 7
+                end = start + 6
+            case 'M':
+                month = np.asarray(target, dtype='int64').astype('datetime64[D]').astype('datetime64[M]')
+                start = month.astype('datetime64[D]').astype('int64')
+                end = (month + np.timedelta64(1, 'M')).astype('datetime64[D]').astype('int64') - 1
+            case _:
+                raise ValueError(f"unsupported freq: {freq}")
+        return start, end
+
+    def _get_index(self, start:int, end:int) -> tuple:
+        """ 指定期間を含む営業日インデックスを取得
+
+        指定期間がインデックス範囲外の場合はインデックスを拡張する。
+
+        Args:
+            start (int): 開始日(1970/1/1からの日数)
+            end (int): 終了日(1970/1/1からの日数)
+        Returns:
+            tuple: (インデックス開始日, 累積営業日数, 営業日位置)
+        """
+        index = self._index
+        base, cum, _ = index
+        if start < base or end >= base + len(cum) - 1:
+            with self._index_lock:
+                index = self._index
+                base, cum, _ = index
+                if start < base or end >= base + len(cum) - 1:
+                    # 拡張は現在の範囲長以上とし、再構築回数を抑える
+                    length = len(cum) - 1
+                    new_base = min(base, start - length) if start < base else base
+                    new_end = base + length
+                    if end >= new_end:
+                        new_end = max(new_end + length, end + 1)
+                    self._build_index(int(new_base), int(new_end))
+                    index = self._index
+        return index
+
+    def _build_default_index(self) -> None:
+        """ 営業日インデックスの初期構築(LIMIT_DATE～HORIZON_YEARS年後の年末)
+        """
+        self._build_index(
+            self._to_ordinal(self.LIMIT_DATE),
+            self._to_ordinal(date(datetime.now().year + self.HORIZON_YEARS, 12, 31)) + 1)
+
+    def _build_index(self, start:int, end:int) -> None:
+        """ 営業日インデックスの構築
+
+        Args:
+            start (int): 開始日(1970/1/1からの日数)
+            end (int): 終了日の翌日(1970/1/1からの日数)
+        """
+        days = np.arange(start, end, dtype='int64').astype('datetime64[D]')
+        is_buzzday = np.is_busday(days, holidays=self._holidays)
+        cum = np.zeros(len(days) + 1, dtype='int32')
+        np.cumsum(is_buzzday, out=cum[1:])
+        buzzdays = np.flatnonzero(is_buzzday).astype('int32')
+        # 参照側が不整合な組を読まないよう、組として一括で差し替える
+        self._index = (start, cum, buzzdays)
+
+
+class CommonCalendarMemo:
+    """ 営業日数メモ化クラス
+
+    カレンダーの営業日数取得(count_businessday)の結果を件数上限付きのLRUで保持する。
+    その他のメソッドは元のカレンダーに委譲するため、CommonCalendarの代わりに
+    CommonEVM.set_input_data()等へ渡し、1回の評価処理内で複数のCommonEVMから共有できる。
+    """
+    _calendar:CommonCalendar = None # 元のカレンダー
+    _count_businessday = None # メモ化した営業日数取得
+
+    def __init__(self, calendar:CommonCalendar, max_size:int=65536) -> None:
+        """コンストラクタ
+
+        Args:
+            calendar (CommonCalendar): 元のカレンダー
+            max_size (int): 保持する最大件数
+        """
+        self._calendar = calendar
+        self._count_businessday = functools.lru_cache(maxsize=max_size)(calendar.count_businessday)
+
+    def __getattr__(self, name:str):
+        """ 元のカレンダーへの委譲
+
+        Args:
+            name (str): 属性名
+        Returns:
+            元のカレンダーの属性
+        """
+        return getattr(self._calendar, name)
+
+    def count_businessday(self, start_date:date, end_date:date) -> int:
+        """ 営業日数取得(メモ化)
+
+        Args:
+            start_date (datetime.date): 開始日
+            end_date (datetime.date): 終了日
+
+        Returns:
+            int: 営業日数
+        """
+        return self._count_businessday(start_date, end_date)
+
+    def get_stats(self) -> dict:
+        """ メモ化統計取得
+
+        Returns:
+            dict: 統計情報
+                hits (int): ヒット数
+                misses (int): ミス数
+                size (int): 保持件数
+                max_size (int): 最大件数
+                hit_rate (float): ヒット率
+        """
+        info = self._count_businessday.cache_info()
+        total = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'max_size': info.maxsize,
+            'hit_rate': info.hits / total if total > 0 else 0.0,
+        }
+
+    def clear(self) -> None:
+        """ メモ化結果と統計の初期化
+        """
+        self._count_businessday.cache_clear()
@@ -1,6 +1,8 @@
 from .common_calendar import CommonCalendar
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import date
+import numpy as np
+import pandas as pd
 
 @dataclass(frozen=True)
 class CommonEVMInput:
@@ -19,27 +21,44 @@ class CommonEVMInput:
     estimated_hours:float = float(0) # 予定工数
     spent_hours:float = float(0) # 作業工数
 
-class CommonEVM:
-    """EVM計算クラス
+@dataclass(frozen=True, slots=True)
+class CommonEVMResult:
+    """EVM計算結果クラス
+
+    1チケット分のEVM指標を保持する不変の軽量レコード。
     """
     # EVM基本指標
-    __pv:float = float(0) # PV(計画価値)
-    __ev:float = float(0) # EV(出来高)
-    __ac:float = float(0) # AC(実コスト)
+    pv:float = float(0) # PV(計画価値)
+    ev:float = float(0) # EV(出来高)
+    ac:float = float(0) # AC(実コスト)
     # EVM管理指標
-    __sv:float = float(0) # SV(スケジュール差異)
-    __cv:float = float(0) # CV(コスト差異)
-    __spi:float = float(0) # SPI(スケジュール効率指数)
-    __cpi:float = float(0) # CPI(コスト効率指数)
+    sv:float = float(0) # SV(スケジュール差異)
+    cv:float = float(0) # CV(コスト差異)
+    spi:float = float(0) # SPI(スケジュール効率指数)
+    cpi:float = float(0) # CPI(コスト効率指数)
     # EVM予測指標
-    __bac:float = float(0) # BAC(予算総額)
-    __etc:float = float(0) # ETC(残作業コスト予測)
-    __eac:float = float(0) # EAC(完了時コスト予測)
-    __vac:float = float(0) # VAC(完了時コスト差異)
+    bac:float = float(0) # BAC(予算総額)
+    etc:float = float(0) # ETC(残作業コスト予測)
+    eac:float = float(0) # EAC(完了時コスト予測)
+    vac:float = float(0) # VAC(完了時コスト差異)
 
+class CommonEVM:
+    """EVM計算クラス
+
+    計算本体はevaluate()(純粋関数)であり、本クラスのインスタンスは
+    set_input_data()/calculate()/get_xx()形式の互換インターフェースを提供する。
+    """
     # 丸め桁数定義
     __round:int = 3 #　丸め桁数(FIXED)
 
+    # 一括計算の結果列定義
+    RESULT_COLUMNS:tuple = ('pv', 'ev', 'ac', 'sv', 'cv', 'spi', 'cpi', 'bac', 'etc', 'eac', 'vac')
+    # 一括計算の結果格納用の構造化配列型
+    RESULT_DTYPE:np.dtype = np.dtype({'names': list(RESULT_COLUMNS), 'formats': ['float64'] * len(RESULT_COLUMNS)})
+
+    # 計算結果
+    __result:CommonEVMResult = CommonEVMResult()
+
     # 入力データ
     __input_data:CommonEVMInput = None
     __as_of_date:date = None
@@ -49,17 +68,12 @@ class CommonEVM:
     __spent_days:int = 0 # 当日作業日数
 
     #
-    # コンストラクタ/デストラクタ
+    # コンストラクタ
     #
     def __init__(self) -> None:
         """コンストラクタ
         """
         pass
-    
-    def __del__(self) -> None:
-        """デストラクタ
-        """
-        pass
 
     #
     # publicメソッド
@@ -67,7 +81,7 @@ class CommonEVM:
     def calculate(self) -> None:
         """EVM計算メソッド
         """
-        self.__calculate()
+        self.__result = self.__evaluate(self.__input_data, self.__totaol_days, self.__spent_days)
 
     def set_input_data(self, input_data:CommonEVMInput, as_of_date:date, calendar:CommonCalendar) -> None:
         """EVM入力データ設定メソッド
@@ -79,34 +93,135 @@ class CommonEVM:
         # 入力データ設定
         self.__input_data = input_data
         self.__as_of_date = as_of_date
-
         # 進捗データ計算
-        # 却下ステータスは対象外
-        if(self.__input_data.status_reject is False):
-            # 日程計画がある場合に作業日数を計算する
-            if(self.__input_data.start_date is None) or (self.__input_data.due_date is None):
-                # 総作業日数
-                self.__totaol_days = 0
-                # 当日作業日数
-                self.__spent_days = 0
-            else:
-                # 総作業日数
-                self.__totaol_days = calendar.count_businessday(self.__input_data.start_date, self.__input_data.due_date)
-                # 当日作業日数
-                self.__spent_days = calendar.count_businessday(self.__input_data.start_date, self.__as_of_date)
-        else:
-            # 総作業日数
-            self.__totaol_days = 0
-            # 当日作業日数
-            self.__spent_days = 0
-    
+        self.__totaol_days, self.__spent_days = self.__count_days(input_data, as_of_date, calendar)
+
+    def get_result(self) -> CommonEVMResult:
+        """EVM計算結果取得メソッド
+
+        Returns:
+            CommonEVMResult: EVM計算結果
+        """
+        return self.__result
+
+    @classmethod
+    def evaluate(cls, input_data:CommonEVMInput, as_of_date:date, calendar:CommonCalendar) -> CommonEVMResult:
+        """EVM計算メソッド(純粋関数)
+
+        インスタンスを生成せずに1チケット分のEVM指標を計算する。
+
+        Args:
+            input_data (CommonEVMInput): EVM入力データ
+            as_of_date (date): 評価日
+            calendar (CommonCalendar): カレンダー
+        Returns:
+            CommonEVMResult: EVM計算結果
+        """
+        total_days, spent_days = cls.__count_days(input_data, as_of_date, calendar)
+        return cls.__evaluate(input_data, total_days, spent_days)
+
+    @classmethod
+    def evaluate_many(cls, inputs:list, as_of_date:date, calendar:CommonCalendar, out:np.ndarray=None) -> np.ndarray:
+        """EVM一括計算メソッド(構造化配列出力)
+
+        Args:
+            inputs (list): CommonEVMInputのリスト
+            as_of_date (date): 評価日
+            calendar (CommonCalendar): カレンダー
+            out (np.ndarray): 結果の格納先(RESULT_DTYPE型、inputsと同じ長さ)。指定なしの場合は新規作成
+        Returns:
+            np.ndarray: EVM計算結果(RESULT_DTYPE型の構造化配列)
+        """
+        if out is None:
+            out = np.zeros(len(inputs), dtype=cls.RESULT_DTYPE)
+        elif len(out) != len(inputs):
+            raise ValueError(f"out length mismatch: {len(out)} != {len(inputs)}")
+        return cls._evaluate_records(cls._input_records(inputs), as_of_date, calendar, out)
+
+    @classmethod
+    def calculate_batch(cls, frame, as_of_date, calendar:CommonCalendar) -> pd.DataFrame:
+        """EVM一括計算メソッド
+
+        CommonEVMInputの項目名を列名とする表を列単位で一括計算する。
+        計算規則(日程未計画・却下ステータス・ゼロ除算時の値)と丸めはcalculate()と同じ。
+
+        Args:
+            frame (pd.DataFrame | dict): EVM入力データ(列名はCommonEVMInputの項目名、欠落列は既定値)
+            as_of_date (date | array-like): 評価日(行ごとの評価日の配列も可)
+            calendar (CommonCalendar): カレンダー
+        Returns:
+            pd.DataFrame: EVM指標(列はRESULT_COLUMNS、行はframeと同じ並び)
+        """
+        columns = cls._input_columns(frame)
+        total_days, spent_days = cls._count_days(columns, as_of_date, calendar)
+        result = cls._calculate_columns(columns, total_days, spent_days)
+        index = frame.index if isinstance(frame, pd.DataFrame) else None
+        return pd.DataFrame(result, index=index, columns=list(cls.RESULT_COLUMNS))
+
+    @classmethod
+    def calculate_series(cls, frame, start_date:date, end_date:date, calendar:CommonCalendar, freq:str='D', chunk_size:int=4096) -> pd.DataFrame:
+        """EVM時系列計算メソッド
+
+        評価期間の各評価日について、全チケット合計のPV/EV/AC/SPI/CPIを計算する(S字曲線用)。
+        評価日で変化するのは当日作業日数のみのため、チケットごとの総作業日数と
+        開始日前日までの累積営業日数を1回だけ求め、評価日ごとの営業日数の差分からPVを求める。
+        各チケットのPVはcalculate()と同様に丸めた後で合計する。
+
+        Args:
+            frame (pd.DataFrame | dict): EVM入力データ(列名はCommonEVMInputの項目名)
+            start_date (date): 評価期間開始日
+            end_date (date): 評価期間終了日
+            calendar (CommonCalendar): カレンダー
+            freq (str): 評価日の間隔('D':営業日ごと, 'W':週の最終営業日, 'M':月の最終営業日)
+            chunk_size (int): 一度に計算するチケット数(メモリ使用量の上限)
+        Returns:
+            pd.DataFrame: 評価日ごとの指標(列はpv, ev, ac, spi, cpi、インデックスは評価日)
+        """
+        digits = cls.__round
+        columns = cls._input_columns(frame)
+        as_of_dates = cls._series_dates(start_date, end_date, calendar, freq)
+        if len(as_of_dates) == 0:
+            # 評価期間に営業日が無い場合は空の表
+            empty = np.array([], dtype='float64')
+            return pd.DataFrame({name: empty for name in ('pv', 'ev', 'ac', 'spi', 'cpi')},
+                                index=pd.DatetimeIndex(as_of_dates, name='as_of_date'))
+
+        # 評価日に依存しない値(総作業日数, EV, AC)
+        total_days, _ = cls._count_days(columns, start_date, calendar)
+        constant = cls._calculate_columns(columns, total_days, np.zeros_like(total_days))
+        counted = ~columns['status_reject'] & ~pd.isna(columns['start_date']) & ~pd.isna(columns['due_date'])
+        scheduled = ~pd.isna(columns['start_date']) & ~pd.isna(columns['due_date'])
+
+        # 累積営業日数(基準日から評価日まで / 基準日から開始日前日まで)
+        start_dates = np.asarray(pd.to_datetime(pd.Series(columns['start_date'])), dtype='datetime64[D]')
+        base_date = as_of_dates[0] if not counted.any() else min(as_of_dates[0], start_dates[counted].min())
+        as_of_offsets = calendar.count_businessday_many([base_date], as_of_dates)
+        start_offsets = calendar.count_businessday_many([base_date], start_dates - np.timedelta64(1, 'D'))
+
+        # チケットを分割してPVを合計(当日作業日数 = 評価日までの営業日数 - 開始日前日までの営業日数)
+        pv = np.zeros(len(as_of_dates), dtype='float64')
+        for head in range(0, len(total_days), chunk_size):
+            part = slice(head, head + chunk_size)
+            spent_days = np.maximum(as_of_offsets[None, :] - start_offsets[part, None], 0)
+            spent_days = np.where(counted[part, None], spent_days, 0)
+            pv += cls._calculate_pv(columns['estimated_hours'][part, None], scheduled[part, None], total_days[part, None], spent_days).sum(axis=0)
+
+        # 合計値と効率指数
+        pv = cls._round_array(pv, digits)
+        ev = cls._round_array(np.full(len(as_of_dates), constant['ev'].sum()), digits)
+        ac = cls._round_array(np.full(len(as_of_dates), constant['ac'].sum()), digits)
+        bac = cls._round_array(np.full(len(as_of_dates), constant['bac'].sum()), digits)
+        result = cls._derive_columns(pv, ev, ac, bac)
+        return pd.DataFrame({name: result[name] for name in ('pv', 'ev', 'ac', 'spi', 'cpi')},
+                            index=pd.DatetimeIndex(as_of_dates, name='as_of_date'))
+
     def get_pv(self) -> float:
         """PV取得メソッド
 
         Returns:
             float: PV値
         """
-        return self.__pv
+        return self.__result.pv
     
     def get_ev(self) -> float:
         """EV取得メソッド
@@ -114,7 +229,7 @@ class CommonEVM:
         Returns:
             float: EV値
         """
-        return self.__ev
+        return self.__result.ev
     
     def get_ac(self) -> float:
         """AC取得メソッド
@@ -122,7 +237,7 @@ class CommonEVM:
         Returns:
             float: AC値
         """
-        return self.__ac
+        return self.__result.ac
     
     def get_sv(self) -> float:
         """SV取得メソッド
@@ -130,7 +245,7 @@ class CommonEVM:
         Returns:
             float: SV値
         """
-        return self.__sv
+        return self.__result.sv
     
     def get_cv(self) -> float:
         """CV取得メソッド
@@ -138,7 +253,7 @@ class CommonEVM:
         Returns:
             float: CV値
         """
-        return self.__cv
+        return self.__result.cv
     
     def get_spi(self) -> float:
         """SPI取得メソッド
@@ -146,7 +261,7 @@ class CommonEVM:
         Returns:
             float: SPI値
         """
-        return self.__spi
+        return self.__result.spi
     
     def get_cpi(self) -> float:
         """CPI取得メソッド
@@ -154,7 +269,7 @@ class CommonEVM:
         Returns:
             float: CPI値
         """
-        return self.__cpi
+        return self.__result.cpi
     
     def get_bac(self) -> float:
         """BAC取得メソッド
@@ -162,7 +277,7 @@ class CommonEVM:
         Returns:
             float: BAC値
         """
-        return self.__bac
+        return self.__result.bac
     
     def get_etc(self) -> float:
         """ETC取得メソッド
@@ -170,7 +285,7 @@ class CommonEVM:
         Returns:
             float: ETC値
         """
-        return self.__etc
+        return self.__result.etc
     
     def get_eac(self) -> float:
         """EAC取得メソッド
@@ -178,7 +293,7 @@ class CommonEVM:
         Returns:
             float: EAC値
         """
-        return self.__eac
+        return self.__result.eac
     
     def get_vac(self) -> float:
         """VAC取得メソッド
@@ -186,193 +301,330 @@ class CommonEVM:
         Returns:
             float: VAC値
         """
-        return self.__vac
+        return self.__result.vac
 
     #
     # privateメソッド(EVM)
     #
-    def __calculate(self) -> None:
-        """EVM計算メソッド
+    @classmethod
+    def __count_days(cls, input_data:CommonEVMInput, as_of_date:date, calendar:CommonCalendar) -> tuple:
+        """作業日数計算メソッド
+
+        Args:
+            input_data (CommonEVMInput): EVM入力データ
+            as_of_date (date): 評価日
+            calendar (CommonCalendar): カレンダー
+        Returns:
+            tuple: (総作業日数, 当日作業日数)
         """
-        self.__pv = self.__calculate_pv()
-        self.__ev = self.__calculate_ev()
-        self.__ac = self.__calculate_ac()
-        self.__sv = self.__calculate_sv()
-        self.__cv = self.__calculate_cv()
-        self.__spi = self.__calculate_spi()
-        self.__cpi = self.__calculate_cpi()
-        self.__bac = self.__calculate_bac()
-        self.__etc = self.__calculate_etc()
-        self.__eac = self.__calculate_eac()
-        self.__vac = self.__calculate_vac()
-
-    def __calculate_pv(self) -> float:
-        """PV計算メソッド
-        PV = 予定工数　×　当日作業日数　÷　総作業日数
+        # 却下ステータスは対象外
+        if not cls._is_rejected(input_data.status_reject):
+            # 日程計画がある場合に作業日数を計算する
+            if(input_data.start_date is None) or (input_data.due_date is None):
+                return 0, 0
+            # 総作業日数, 当日作業日数
+            return (calendar.count_businessday(input_data.start_date, input_data.due_date),
+                    calendar.count_businessday(input_data.start_date, as_of_date))
+        return 0, 0
+
+    @classmethod
+    def __evaluate(cls, input_data:CommonEVMInput, total_days:int, spent_days:int) -> CommonEVMResult:
+        """EVM計算メソッド
 
+        Args:
+            input_data (CommonEVMInput): EVM入力データ
+            total_days (int): 総作業日数
+            spent_days (int): 当日作業日数
         Returns:
-            float: PV値
+            CommonEVMResult: EVM計算結果
         """
-        # 日程未計画の場合
-        if(self.__input_data.start_date is None) or (self.__input_data.due_date is None):
-            # PV = 0
-            self.__pv = float(0)
-        # 予定作業期間内(総作業日数 > 当日作業日数)の場合
-        elif(self.__spent_days < self.__totaol_days):
+        digits = cls.__round
+        estimated_hours = input_data.estimated_hours
+
+        # PV = 予定工数　×　当日作業日数　÷　総作業日数
+        if(input_data.start_date is None) or (input_data.due_date is None):
+            # 日程未計画の場合はPV = 0
+            pv = float(0)
+        elif(spent_days < total_days):
+            # 予定作業期間内(総作業日数 > 当日作業日数)の場合
             try:
-                # PV = 予定工数　×　当日作業日数　÷　総作業日数
-                self.__pv = (self.__input_data.estimated_hours * self.__spent_days) / self.__totaol_days
+                pv = (estimated_hours * spent_days) / total_days
             except Exception:
-                # PV=0
-                self.__pv = float(0)
-        # 予定作業期間外(総作業日数 <= 当日作業日数)の場合
+                pv = float(0)
         else:
-            # PV = 予定工数
-            self.__pv = self.__input_data.estimated_hours
-        # PVを丸めて復帰
-        self.__pv = round(self.__pv,self.__round)
-        return self.__pv
-
-    def __calculate_ev(self) -> float:
-        """EV計算メソッド
-        EV = 予定工数　×　進捗率　※終了ステータスは進捗率100%とみなす
+            # 予定作業期間外(総作業日数 <= 当日作業日数)の場合はPV = 予定工数
+            pv = estimated_hours
+        pv = round(pv, digits)
 
-        Returns:
-            float: EV値
-        """
-        # 終了ステータスの場合は進捗率100%とみなす
-        if(self.__input_data.status_ended == True):
-            # EV = 予定工数
-            self.__ev = self.__input_data.estimated_hours
+        # EV = 予定工数　×　進捗率　※終了ステータスは進捗率100%とみなす
+        if(input_data.status_ended == True):
+            ev = estimated_hours
         else:
-            # EV = 予定工数　×　進捗率
-            self.__ev = (self.__input_data.estimated_hours * self.__input_data.done_ratio) / float(100)
-        # 丸めて復帰
-        self.__ev = round(self.__ev,self.__round)
-        return self.__ev
+            ev = (estimated_hours * input_data.done_ratio) / float(100)
+        ev = round(ev, digits)
+
+        # AC = 作業工数
+        ac = round(input_data.spent_hours, digits)
+        # SV = EV - PV
+        sv = round(ev - pv, digits)
+        # CV = EV - AC
+        cv = round(ev - ac, digits)
+
+        # SPI = EV ÷ PV
+        try:
+            spi = ev / pv
+        except:
+            spi = float(1)
+        spi = round(spi, digits)
+
+        # CPI = EV ÷ AC
+        try:
+            cpi = ev / ac
+        except:
+            cpi = float(1)
+        cpi = round(cpi, digits)
+
+        # BAC = 予定工数
+        bac = round(estimated_hours, digits)
+
+        # ETC = (BAC-EV) ÷ CPI
+        try:
+            etc = (bac - ev) / cpi
+        except:
+            etc = float(0)
+        etc = round(etc, digits)
+
+        # EAC = AC + ETC
+        eac = round(ac + etc, digits)
+        # VAC = BAC - EAC
+        vac = round(bac - eac, digits)
 
-    def __calculate_ac(self) -> float:
-        """AC計算メソッド
-        AC = 作業工数
+        return CommonEVMResult(pv=pv, ev=ev, ac=ac, sv=sv, cv=cv, spi=spi, cpi=cpi,
+                               bac=bac, etc=etc, eac=eac, vac=vac)
 
+    #
+    # protectedメソッド(一括計算)
+    #
+    @classmethod
+    def _input_columns(cls, frame) -> dict:
+        """EVM入力データの列変換メソッド
+
+        Args:
+            frame (pd.DataFrame | dict): EVM入力データ
         Returns:
-            float: AC値
+            dict: 項目名 -> 列(ステータスはbool配列、工数・進捗率はfloat配列、日付は元の列)
+                  status_rejectは_is_rejected()による判定結果
         """
-        # AC = 作業工数
-        self.__ac = self.__input_data.spent_hours
-        # 丸めて復帰
-        self.__ac = round(self.__ac,self.__round)
-        return self.__ac
+        if not isinstance(frame, pd.DataFrame):
+            frame = pd.DataFrame(dict(frame))
+        columns = {}
+        for field in fields(CommonEVMInput):
+            if field.name in frame:
+                values = frame[field.name]
+            else:
+                values = pd.Series(field.default, index=frame.index, dtype=object)
+            if field.name == 'status_reject':
+                # 却下判定はcalculate()と同じ規則
+                columns[field.name] = np.fromiter((cls._is_rejected(value) for value in values.astype(object)), dtype=bool, count=len(values))
+            elif field.name.startswith('status_'):
+                # 欠損値はFalse扱い
+                values = values.astype(object)
+                columns[field.name] = values.where(values.notna(), False).to_numpy(dtype=bool)
+            elif field.name.endswith('_date'):
+                columns[field.name] = values.to_numpy()
+            else:
+                columns[field.name] = pd.to_numeric(values).to_numpy(dtype='float64')
+        return columns
 
-    def __calculate_sv(self) -> float:
-        """SV計算メソッド
-        SV = EV - PV
+    @staticmethod
+    def _is_rejected(status_reject) -> bool:
+        """却下ステータス判定メソッド(calculate()・一括計算で共通)
 
+        従来のcalculate()と同じく、Falseそのもの以外(0, None, np.False_等)は却下とみなす。
+
+        Args:
+            status_reject: 却下ステータスフラグ
         Returns:
-            float: SV値
+            bool: True=却下(作業日数0), False=対象
         """
-        # SV = EV - PV
-        self.__sv = self.__ev - self.__pv
-        # 丸めて復帰
-        self.__sv = round(self.__sv,self.__round)
-        return self.__sv
+        return status_reject is not False
 
-    def __calculate_cv(self) -> float:
-        """CV計算メソッド
-        CV = EV - AC
+    @classmethod
+    def _input_records(cls, inputs:list) -> dict:
+        """EVM入力データ(CommonEVMInputのリスト)の列変換メソッド
 
+        Args:
+            inputs (list): CommonEVMInputのリスト
         Returns:
-            float: CV値
+            dict: 項目名 -> 値のリスト(calculate_batchの入力形式)
         """
-        # CV = EV - AC
-        self.__cv = self.__ev - self.__ac
-        # 丸めて復帰
-        self.__cv = round(self.__cv,self.__round)
-        return self.__cv
+        return {field.name: [getattr(input_data, field.name) for input_data in inputs] for field in fields(CommonEVMInput)}
 
-    def __calculate_spi(self) -> float:
-        """SPI計算メソッド
-        SPI = EV ÷ PV
+    @classmethod
+    def _evaluate_records(cls, records, as_of_date, calendar:CommonCalendar, out:np.ndarray) -> np.ndarray:
+        """EVM一括計算メソッド(構造化配列への格納)
 
+        Args:
+            records (pd.DataFrame | dict): EVM入力データ(calculate_batchの入力形式)
+            as_of_date (date | array-like): 評価日
+            calendar (CommonCalendar): カレンダー
+            out (np.ndarray): 結果の格納先(RESULT_DTYPE型)
         Returns:
-            float: SPI値
+            np.ndarray: 結果の格納先
         """
-        # SPI = EV ÷ PV
-        try:
-            self.__spi = self.__ev / self.__pv
-        except:
-            self.__spi = float(1)
-        # 丸めて復帰
-        self.__spi = round(self.__spi,self.__round)
-        return self.__spi
+        columns = cls._input_columns(records)
+        total_days, spent_days = cls._count_days(columns, as_of_date, calendar)
+        result = cls._calculate_columns(columns, total_days, spent_days)
+        for name in cls.RESULT_COLUMNS:
+            out[name] = result[name]
+        return out
 
-    def __calculate_cpi(self) -> float:
-        """CPI計算メソッド
-        CPI = EV ÷ AC
+    @classmethod
+    def _count_days(cls, columns:dict, as_of_date, calendar:CommonCalendar) -> tuple:
+        """総作業日数・当日作業日数の一括計算メソッド
 
+        Args:
+            columns (dict): EVM入力データの列
+            as_of_date (date | array-like): 評価日
+            calendar (CommonCalendar): カレンダー
         Returns:
-            float: CPI値
+            tuple: (総作業日数(int64配列), 当日作業日数(int64配列))
         """
-        # CPI = EV ÷ AC
-        try:
-            self.__cpi = self.__ev / self.__ac
-        except:
-            self.__cpi = float(1)
-        # 丸めて復帰
-        self.__cpi = round(self.__cpi,self.__round)
-        return self.__cpi
-
-    def __calculate_bac(self) -> float:
-        """BAC計算メソッド
-        BAC = 予定工数
+        start_date = columns['start_date']
+        # 却下ステータス・日程未計画は作業日数0
+        counted = ~columns['status_reject'] & ~pd.isna(start_date) & ~pd.isna(columns['due_date'])
+        total_days = np.where(counted, calendar.count_businessday_many(start_date, columns['due_date']), 0)
+        as_of_date = as_of_date if np.ndim(as_of_date) > 0 else [as_of_date]
+        spent_days = np.where(counted, calendar.count_businessday_many(start_date, as_of_date), 0)
+        return total_days, spent_days
+
+    @classmethod
+    def _calculate_columns(cls, columns:dict, total_days:np.ndarray, spent_days:np.ndarray) -> dict:
+        """EVM指標の一括計算メソッド
 
+        Args:
+            columns (dict): EVM入力データの列
+            total_days (np.ndarray): 総作業日数
+            spent_days (np.ndarray): 当日作業日数
         Returns:
-            float: BAC値
+            dict: 指標名 -> 指標値(float配列)
         """
+        digits = cls.__round
+        estimated_hours = columns['estimated_hours']
+        scheduled = ~pd.isna(columns['start_date']) & ~pd.isna(columns['due_date'])
+        pv = cls._calculate_pv(estimated_hours, scheduled, total_days, spent_days)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # EV = 予定工数　×　進捗率(終了ステータスは進捗率100%)
+            ev = np.where(columns['status_ended'], estimated_hours, (estimated_hours * columns['done_ratio']) / float(100))
+        ev = cls._round_array(ev, digits)
+        # AC = 作業工数
+        ac = cls._round_array(columns['spent_hours'], digits)
         # BAC = 予定工数
-        self.__bac = self.__input_data.estimated_hours
-        # 丸めて復帰
-        self.__bac = round(self.__bac,self.__round)
-        return self.__bac
+        bac = cls._round_array(estimated_hours, digits)
+        return cls._derive_columns(pv, ev, ac, bac)
 
-    def __calculate_etc(self) -> float:
-        """ETC計算メソッド
-        ETC = (BAC-EV) ÷ CPI
+    @classmethod
+    def _derive_columns(cls, pv:np.ndarray, ev:np.ndarray, ac:np.ndarray, bac:np.ndarray) -> dict:
+        """EVM管理指標・予測指標の一括計算メソッド
 
+        チケット単位の値に加え、集計済みのPV/EV/AC/BACからの指標算出にも使用する。
+
+        Args:
+            pv (np.ndarray): PV値(丸め済み)
+            ev (np.ndarray): EV値(丸め済み)
+            ac (np.ndarray): AC値(丸め済み)
+            bac (np.ndarray): BAC値(丸め済み)
         Returns:
-            float: ETC値
+            dict: 指標名 -> 指標値(float配列)
         """
-        # ETC = (BAC-EV) ÷ CPI
-        try:
-            self.__etc = (self.__bac - self.__ev) / self.__cpi
-        except:
-            self.__etc = float(0)
-        # 丸めて復帰
-        self.__etc = round(self.__etc,self.__round)
-        return self.__etc
+        digits = cls.__round
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # SV = EV - PV, CV = EV - AC
+            sv = cls._round_array(ev - pv, digits)
+            cv = cls._round_array(ev - ac, digits)
+            # SPI = EV ÷ PV, CPI = EV ÷ AC(ゼロ除算時は1)
+            spi = cls._round_array(np.where(pv == 0, 1.0, ev / pv), digits)
+            cpi = cls._round_array(np.where(ac == 0, 1.0, ev / ac), digits)
+            # ETC = (BAC-EV) ÷ CPI(ゼロ除算時は0)
+            etc = cls._round_array(np.where(cpi == 0, 0.0, (bac - ev) / cpi), digits)
+        # EAC = AC + ETC, VAC = BAC - EAC
+        eac = cls._round_array(ac + etc, digits)
+        vac = cls._round_array(bac - eac, digits)
+        return {'pv': pv, 'ev': ev, 'ac': ac, 'sv': sv, 'cv': cv, 'spi': spi, 'cpi': cpi,
+                'bac': bac, 'etc': etc, 'eac': eac, 'vac': vac}
+
+    @classmethod
+    def _calculate_pv(cls, estimated_hours:np.ndarray, scheduled:np.ndarray, total_days:np.ndarray, spent_days:np.ndarray) -> np.ndarray:
+        """PVの一括計算メソッド
+        PV = 予定工数　×　当日作業日数　÷　総作業日数(予定作業期間外は予定工数、日程未計画は0)
 
-    def __calculate_eac(self) -> float:
-        """EAC計算メソッド
-        EAC = AC + ETC
+        Args:
+            estimated_hours (np.ndarray): 予定工数
+            scheduled (np.ndarray): 日程計画有無
+            total_days (np.ndarray): 総作業日数
+            spent_days (np.ndarray): 当日作業日数
+        Returns:
+            np.ndarray: PV値(丸め済み)
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pv = np.where(spent_days < total_days, (estimated_hours * spent_days) / total_days, estimated_hours)
+        return cls._round_array(np.where(scheduled, pv, 0.0), cls.__round)
 
+    @classmethod
+    def _series_dates(cls, start_date:date, end_date:date, calendar:CommonCalendar, freq:str) -> np.ndarray:
+        """時系列の評価日作成メソッド
+
+        Args:
+            start_date (date): 評価期間開始日
+            end_date (date): 評価期間終了日
+            calendar (CommonCalendar): カレンダー
+            freq (str): 評価日の間隔('D', 'W', 'M')
         Returns:
-            float: ETC値
+            np.ndarray: 評価日(datetime64[D])
         """
-        # EAC = AC + ETC
-        self.__eac = self.__ac + self.__etc
-        # 丸めて復帰
-        self.__eac = round(self.__eac,self.__round)
-        return self.__eac
+        first, last = pd.to_datetime([start_date, end_date]).values.astype('datetime64[D]')
+        days = np.arange(first, last + np.timedelta64(1, 'D'))
+        days = days[~calendar.is_holiday_many(days)]
+        match freq:
+            case 'D':
+                return days
+            case 'W':
+                period = calendar.get_firstday_week_many(days)
+            case 'M':
+                period = calendar.get_firstday_month_many(days)
+            case _:
+                raise ValueError(f"unsupported freq: {freq}")
+        # 期間ごとの最終営業日
+        return days[np.append(period[1:] != period[:-1], True)]
+
+    @classmethod
+    def _round_values(cls, values:np.ndarray) -> np.ndarray:
+        """EVM指標の丸めメソッド(丸め桁数はcalculate()と同じ)
 
-    def __calculate_vac(self) -> float:
-        """VAC計算メソッド
-        VAC = BAC - EAC
+        Args:
+            values (np.ndarray): 丸め対象
+        Returns:
+            np.ndarray: 丸め結果
+        """
+        return cls._round_array(values, cls.__round)
+
+    @staticmethod
+    def _round_array(values:np.ndarray, digits:int) -> np.ndarray:
+        """配列の丸めメソッド
 
+        組込みround()と同じ結果を返す。np.round()は10進での端数0.5付近で
+        round()と結果が異なる場合があるため、該当要素のみround()で再計算する。
+
+        Args:
+            values (np.ndarray): 丸め対象
+            digits (int): 丸め桁数
         Returns:
-            float: VAC値
+            np.ndarray: 丸め結果
         """
-        # VAC = BAC - EAC
-        self.__vac = self.__bac - self.__eac
-        # 丸めて復帰
-        self.__vac = round(self.__vac,self.__round)
-        return self.__vac
+        values = np.asarray(values, dtype='float64')
+        result = np.round(values, digits)
+        scaled = np.abs(values) * (10 ** digits)
+        ambiguous = (np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6) | (scaled >= 2 ** 52)
+        if ambiguous.any():
+            result[ambiguous] = [round(float(value), digits) for value in values[ambiguous]]
+        return result
@@ -0,0 +1,200 @@
+from .common_calendar import CommonCalendar
+from .common_evm import CommonEVM, CommonEVMInput, CommonEVMResult
+from collections import OrderedDict
+from datetime import date
+import hashlib
+import shelve
+import threading
+import numpy as np
+
+class CommonEVMCache:
+    """EVM計算結果キャッシュクラス
+
+    (EVM入力データ, 評価日, カレンダーの休日セット)をキーとしてチケットごとの計算結果を保持し、
+    新規・変更されたチケットのみを再計算する。
+    メモリ上は件数上限付きのLRUで管理し、保存先を指定した場合はshelveファイルにも保存する。
+    """
+    # protected members
+    _max_size:int = 0 # メモリ上の最大件数
+    _store_path:str = None # 保存先ファイル
+    _store:shelve.Shelf = None # 保存先
+    _entries:OrderedDict = None # キー -> 計算結果(LRU順)
+    _lock:threading.Lock = None # キャッシュ操作用ロック
+    _hits:int = 0 # ヒット数(メモリ)
+    _store_hits:int = 0 # ヒット数(保存先)
+    _misses:int = 0 # ミス数
+    _evictions:int = 0 # 追い出し数
+
+    #
+    # constructor / destructor
+    #
+    def __init__(self, max_size:int = 100000, store_path:str = None) -> None:
+        """コンストラクタ
+
+        Args:
+            max_size (int): メモリ上の最大件数
+            store_path (str): 保存先ファイル(指定なしの場合はメモリ上のみ)
+        """
+        self._max_size = max_size
+        self._store_path = store_path
+        self._store = shelve.open(store_path) if store_path is not None else None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._store_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __enter__(self) -> 'CommonEVMCache':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    #
+    # public methods
+    #
+    def evaluate(self, input_data:CommonEVMInput, as_of_date:date, calendar:CommonCalendar) -> CommonEVMResult:
+        """EVM計算(キャッシュ利用)
+
+        Args:
+            input_data (CommonEVMInput): EVM入力データ
+            as_of_date (date): 評価日
+            calendar (CommonCalendar): カレンダー
+        Returns:
+            CommonEVMResult: EVM計算結果
+        """
+        return self.evaluate_many([input_data], as_of_date, calendar)[0]
+
+    def evaluate_many(self, inputs:list, as_of_date:date, calendar:CommonCalendar) -> list:
+        """EVM一括計算(キャッシュ利用)
+
+        キャッシュに無いチケットのみをまとめて一括計算する。
+
+        Args:
+            inputs (list): CommonEVMInputのリスト
+            as_of_date (date): 評価日
+            calendar (CommonCalendar): カレンダー
+        Returns:
+            list: CommonEVMResultのリスト(入力順)
+        """
+        fingerprint = calendar.get_fingerprint()
+        results = [None] * len(inputs)
+        missing = [] # 未計算の入力データ番号
+        with self._lock:
+            for position, input_data in enumerate(inputs):
+                result = self._lookup((input_data, as_of_date, fingerprint))
+                if result is None:
+                    missing.append(position)
+                else:
+                    results[position] = result
+
+        if missing:
+            # 未計算分を一括計算
+            out = np.zeros(len(missing), dtype=CommonEVM.RESULT_DTYPE)
+            records = CommonEVM._input_records([inputs[position] for position in missing])
+            CommonEVM._evaluate_records(records, as_of_date, calendar, out)
+            with self._lock:
+                for position, row in zip(missing, out.tolist()):
+                    result = CommonEVMResult(*row)
+                    self._insert((inputs[position], as_of_date, fingerprint), result)
+                    results[position] = result
+        return results
+
+    def get_stats(self) -> dict:
+        """キャッシュ統計取得
+
+        Returns:
+            dict: 統計情報
+                size (int): メモリ上の件数
+                hits (int): ヒット数(メモリ)
+                store_hits (int): ヒット数(保存先)
+                misses (int): ミス数(再計算した件数)
+                evictions (int): 追い出し数
+        """
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self._hits,
+                'store_hits': self._store_hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+            }
+
+    def clear(self) -> None:
+        """メモリ上のキャッシュと統計の初期化(保存先は消去しない)
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._store_hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def close(self) -> None:
+        """保存先を閉じる
+        """
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+                self._store = None
+
+    #
+    # protected methods
+    #
+    def _lookup(self, key:tuple) -> CommonEVMResult:
+        """キャッシュ参照(ロック取得済みで呼び出すこと)
+
+        Args:
+            key (tuple): (EVM入力データ, 評価日, 休日セットの識別子)
+        Returns:
+            CommonEVMResult: 計算結果(キャッシュに無い場合はNone)
+        """
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+        if self._store is not None:
+            result = self._store.get(self._store_key(key))
+            if result is not None:
+                self._store_hits += 1
+                self._remember(key, result)
+                return result
+        self._misses += 1
+        return None
+
+    def _insert(self, key:tuple, result:CommonEVMResult) -> None:
+        """キャッシュ登録(ロック取得済みで呼び出すこと)
+
+        Args:
+            key (tuple): (EVM入力データ, 評価日, 休日セットの識別子)
+            result (CommonEVMResult): 計算結果
+        """
+        self._remember(key, result)
+        if self._store is not None:
+            self._store[self._store_key(key)] = result
+
+    def _remember(self, key:tuple, result:CommonEVMResult) -> None:
+        """メモリ上への登録と上限超過分の追い出し(ロック取得済みで呼び出すこと)
+
+        Args:
+            key (tuple): (EVM入力データ, 評価日, 休日セットの識別子)
+            result (CommonEVMResult): 計算結果
+        """
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _store_key(self, key:tuple) -> str:
+        """保存先のキー作成
+
+        Args:
+            key (tuple): (EVM入力データ, 評価日, 休日セットの識別子)
+        Returns:
+            str: 保存先のキー
+        """
+        input_data, as_of_date, fingerprint = key
+        return hashlib.sha1(f"{fingerprint}|{as_of_date!r}|{input_data!r}".encode('utf-8')).hexdigest()
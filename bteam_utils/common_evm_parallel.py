@@ -0,0 +1,130 @@
+from .common_calendar import CommonCalendar
+from .common_evm import CommonEVM
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+import os
+import numpy as np
+import pandas as pd
+
+# ワーカープロセス内のカレンダー(プロセス起動時に1回だけ作成)
+_worker_calendar:CommonCalendar = None
+
+def _init_worker(holidays:np.ndarray) -> None:
+    """ワーカープロセスの初期化
+
+    Args:
+        holidays (np.ndarray): 休日リスト(datetime64[D])
+    """
+    global _worker_calendar
+    _worker_calendar = CommonCalendar(holiday_list=holidays)
+
+def _evaluate_chunk(records, as_of_date:date) -> np.ndarray:
+    """ワーカープロセスでのEVM計算
+
+    Args:
+        records (pd.DataFrame | dict): EVM入力データ(calculate_batchの入力形式)
+        as_of_date (date): 評価日
+    Returns:
+        np.ndarray: EVM計算結果(CommonEVM.RESULT_DTYPE型)
+    """
+    length = len(records) if isinstance(records, pd.DataFrame) else len(records['start_date'])
+    out = np.zeros(length, dtype=CommonEVM.RESULT_DTYPE)
+    return CommonEVM._evaluate_records(records, as_of_date, _worker_calendar, out)
+
+class CommonEVMParallel:
+    """EVM並列計算クラス
+
+    入力データを分割してProcessPoolExecutorで並列に計算し、入力順に結果を結合する。
+    カレンダーは休日リストのみをワーカー起動時に1回だけ渡し、タスクごとには送らない。
+    プロセスプールは複数回の計算で再利用するため、with文またはclose()で終了すること。
+    """
+    # protected members
+    _calendar:CommonCalendar = None # カレンダー
+    _max_workers:int = 0 # ワーカー数
+    _chunk_size:int = 0 # 1タスクあたりのチケット数
+    _executor:ProcessPoolExecutor = None # プロセスプール
+
+    #
+    # constructor / destructor
+    #
+    def __init__(self, calendar:CommonCalendar, max_workers:int = None, chunk_size:int = 20000) -> None:
+        """コンストラクタ
+
+        Args:
+            calendar (CommonCalendar): カレンダー
+            max_workers (int): ワーカー数(指定なしの場合はCPU数)
+            chunk_size (int): 1タスクあたりのチケット数
+        """
+        self._calendar = calendar
+        self._max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self._chunk_size = chunk_size
+        self._executor = None
+
+    def __enter__(self) -> 'CommonEVMParallel':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    #
+    # public methods
+    #
+    def evaluate(self, inputs, as_of_date:date) -> np.ndarray:
+        """EVM並列計算
+
+        Args:
+            inputs (list | pd.DataFrame): CommonEVMInputのリスト、またはCommonEVMInputの項目名を列名とする表
+            as_of_date (date): 評価日
+        Returns:
+            np.ndarray: EVM計算結果(CommonEVM.RESULT_DTYPE型、入力順)
+        """
+        out = np.zeros(len(inputs), dtype=CommonEVM.RESULT_DTYPE)
+        chunks = [(head, min(head + self._chunk_size, len(inputs))) for head in range(0, len(inputs), self._chunk_size)]
+        # ワーカー1つまたは1タスクで済む場合はプロセス内で計算
+        if self._max_workers <= 1 or len(chunks) <= 1:
+            for head, tail in chunks:
+                CommonEVM._evaluate_records(self._chunk_records(inputs, head, tail), as_of_date, self._calendar, out[head:tail])
+            return out
+        # 並列計算(結果は入力順に格納)
+        executor = self._get_executor()
+        futures = [executor.submit(_evaluate_chunk, self._chunk_records(inputs, head, tail), as_of_date) for head, tail in chunks]
+        for (head, tail), future in zip(chunks, futures):
+            out[head:tail] = future.result()
+        return out
+
+    def close(self) -> None:
+        """プロセスプールの終了
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    #
+    # protected methods
+    #
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """プロセスプール取得(未作成の場合は作成)
+
+        Returns:
+            ProcessPoolExecutor: プロセスプール
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers, initializer=_init_worker, initargs=(self._calendar.get_holidays(),))
+        return self._executor
+
+    def _chunk_records(self, inputs, head:int, tail:int):
+        """タスク単位の入力データ取得
+
+        CommonEVMInputのリストは値のリストに変換し、送信するデータ量を抑える。
+
+        Args:
+            inputs (list | pd.DataFrame): EVM入力データ
+            head (int): 開始位置
+            tail (int): 終了位置(この位置は含まない)
+        Returns:
+            pd.DataFrame | dict: EVM入力データ(calculate_batchの入力形式)
+        """
+        if isinstance(inputs, pd.DataFrame):
+            return inputs.iloc[head:tail]
+        return CommonEVM._input_records(inputs[head:tail])
@@ -0,0 +1,183 @@
+from .common_calendar import CommonCalendar
+from .common_evm import CommonEVM, CommonEVMInput
+from .common_xml import CommonXML
+from dataclasses import fields
+from datetime import date, datetime
+import csv
+import time
+import pandas as pd
+
+class CommonEVMPipeline:
+    """EVMストリーミング処理クラス
+
+    チケットのXML/CSVエクスポートからレコードを逐次読み込み、CommonEVMInputに変換してEVMを計算し、
+    結果をCSVへ直接書き込む。一度に保持するのはバッチ1つ分のみのため、
+    メモリ使用量はエクスポートの大きさによらない。
+    """
+    # protected members
+    _calendar:CommonCalendar = None # カレンダー
+    _as_of_date:date = None # 評価日
+    _batch_size:int = 0 # バッチサイズ(チケット数)
+    _key_columns:tuple = () # 結果に引き継ぐ列(チケットID等)
+    _mapper = None # レコード -> CommonEVMInput変換関数
+
+    #
+    # constructor / destructor
+    #
+    def __init__(self, calendar:CommonCalendar, as_of_date:date, batch_size:int = 10000, key_columns:tuple = ('id',), mapper = None) -> None:
+        """コンストラクタ
+
+        Args:
+            calendar (CommonCalendar): カレンダー
+            as_of_date (date): 評価日
+            batch_size (int): バッチサイズ(チケット数)
+            key_columns (tuple): 結果に引き継ぐ列(チケットID等)
+            mapper (callable): レコード(dict) -> CommonEVMInputの変換関数(指定なしの場合はto_input)
+        """
+        self._calendar = calendar
+        self._as_of_date = as_of_date
+        self._batch_size = batch_size
+        self._key_columns = tuple(key_columns)
+        self._mapper = mapper if mapper is not None else self.to_input
+
+    #
+    # public methods
+    #
+    def read_xml(self, infile_path:str, key_body:str, compression:str = 'infer'):
+        """XMLエクスポートからレコードを逐次取得
+
+        Args:
+            infile_path (str): 読込ファイル名
+            key_body (str): Body部のname
+            compression (str): 圧縮形式(CommonXML.open_file()と同じ)
+        Yields:
+            dict: 列名(タグ) -> 値(文字列)
+        """
+        yield from CommonXML().iter_records(infile_path, key_body, compression)
+
+    def read_csv(self, infile_path:str, compression:str = 'infer'):
+        """CSVエクスポートからレコードを逐次取得
+
+        Args:
+            infile_path (str): 読込ファイル名
+            compression (str): 圧縮形式(CommonXML.open_file()と同じ)
+        Yields:
+            dict: 列名 -> 値(文字列)
+        """
+        with CommonXML().open_file(infile_path, 'r', compression, encoding='utf-8-sig', newline='') as fin:
+            yield from csv.DictReader(fin)
+
+    def to_input(self, record:dict) -> CommonEVMInput:
+        """レコードからEVM入力データへの変換(既定の変換関数)
+
+        CommonEVMInputの項目名と同じ列名の値を変換する。
+        空文字・"None"・列なしは既定値とする。
+
+        Args:
+            record (dict): 列名 -> 値(文字列)
+        Returns:
+            CommonEVMInput: EVM入力データ
+        """
+        values = {}
+        for field in fields(CommonEVMInput):
+            text = record.get(field.name)
+            if text is None or str(text) in ('', 'None'):
+                continue
+            if field.name.startswith('status_'):
+                values[field.name] = str(text).strip().lower() in ('true', '1', 'yes')
+            elif field.name.endswith('_date'):
+                values[field.name] = self._to_date(text)
+            else:
+                values[field.name] = float(text)
+        return CommonEVMInput(**values)
+
+    def run(self, records, outfile_path:str, report = None, compression:str = 'infer', compresslevel:int = None) -> dict:
+        """EVM計算とCSV出力
+
+        Args:
+            records (iterable): レコード(dict)の反復可能オブジェクト(read_xml/read_csvの戻り値等)
+            outfile_path (str): 保存ファイル名
+            report (callable): バッチごとに統計情報(dict)を受け取る関数
+            compression (str): 圧縮形式(CommonXML.open_file()と同じ)
+            compresslevel (int): 圧縮レベル
+        Returns:
+            dict: 統計情報
+                rows (int): 出力行数
+                batches (int): バッチ数
+                elapsed (float): 経過時間(秒)
+                rows_per_sec (float): 処理速度(行/秒)
+        """
+        stats = {'rows': 0, 'batches': 0, 'elapsed': 0.0, 'rows_per_sec': 0.0}
+        started = time.perf_counter()
+        with CommonXML().open_file(outfile_path, 'w', compression, compresslevel, encoding='utf-8-sig', newline='') as fout:
+            # Write header
+            fout.write(','.join(self._key_columns + CommonEVM.RESULT_COLUMNS) + '\n')
+            # Write rows (バッチ単位で計算・出力)
+            keys, inputs = [], []
+            for record in records:
+                keys.append([record.get(column) for column in self._key_columns])
+                inputs.append(self._mapper(record))
+                if len(inputs) >= self._batch_size:
+                    self._write_batch(fout, keys, inputs, stats, started, report)
+                    keys, inputs = [], []
+            if inputs:
+                self._write_batch(fout, keys, inputs, stats, started, report)
+        stats['elapsed'] = time.perf_counter() - started
+        stats['rows_per_sec'] = stats['rows'] / stats['elapsed'] if stats['elapsed'] > 0 else 0.0
+        return stats
+
+    #
+    # protected methods
+    #
+    def _write_batch(self, fout, keys:list, inputs:list, stats:dict, started:float, report) -> None:
+        """1バッチ分の計算と出力
+
+        Args:
+            fout: 出力ファイル
+            keys (list): 引き継ぐ列の値(行ごとのリスト)
+            inputs (list): CommonEVMInputのリスト
+            stats (dict): 統計情報(更新する)
+            started (float): 開始時刻(time.perf_counter)
+            report (callable): 統計情報の通知先
+        """
+        result = CommonEVM.calculate_batch(CommonEVM._input_records(inputs), self._as_of_date, self._calendar)
+        lines = []
+        for key, values in zip(keys, result.itertuples(index=False, name=None)):
+            lines.append(','.join(self._quote(value) for value in key + list(values)) + '\n')
+        fout.write(''.join(lines))
+        stats['rows'] += len(inputs)
+        stats['batches'] += 1
+        stats['elapsed'] = time.perf_counter() - started
+        stats['rows_per_sec'] = stats['rows'] / stats['elapsed'] if stats['elapsed'] > 0 else 0.0
+        if report is not None:
+            report(dict(stats))
+
+    def _quote(self, value) -> str:
+        """CSV値の整形(CommonXML.save_csvと同じ形式)
+
+        Args:
+            value: 値
+        Returns:
+            str: 整形後の値(Noneは空文字、それ以外はダブルクォートで囲む)
+        """
+        if value is None or str(value) == "None":
+            return ''
+        return '"' + str(value).replace('"', '""') + '"'
+
+    def _to_date(self, text:str) -> date:
+        """日付文字列の変換
+
+        Args:
+            text (str): 日付文字列
+        Returns:
+            date: 日付
+        """
+        text = str(text).strip()
+        try:
+            return date.fromisoformat(text)
+        except ValueError:
+            pass
+        try:
+            return datetime.fromisoformat(text).date()
+        except ValueError:
+            return pd.Timestamp(text).date()
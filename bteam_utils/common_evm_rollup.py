@@ -0,0 +1,153 @@
+from .common_calendar import CommonCalendar
+from .common_evm import CommonEVM, CommonEVMInput
+from datetime import date
+import numpy as np
+import pandas as pd
+
+class CommonEVMRollup:
+    """EVM集計クラス
+
+    CommonEVMInputを逐次受け取り、任意のグループキー(バージョン・プロジェクト・担当者など)ごとに
+    PV/EV/AC/BACを累積する。チケットごとの計算結果は保持しないため、
+    メモリ使用量はグループ数と一時バッファの大きさのみに比例する。
+    SV/CV/SPI/CPI/ETC/EAC/VACは集計済みの値からCommonEVMと同じ計算式で求める。
+    """
+    # 累積項目定義
+    SUM_COLUMNS:tuple = ('pv', 'ev', 'ac', 'bac')
+
+    # protected members
+    _as_of_date:date = None # 評価日
+    _calendar:CommonCalendar = None # カレンダー
+    _batch_size:int = 0 # 一括計算の単位(チケット数)
+    _groups:dict = None # グループキー -> 累積値の行番号
+    _sums:np.ndarray = None # 累積値(グループ数 × PV/EV/AC/BAC)
+    _counts:np.ndarray = None # チケット数(グループ数)
+    _pending_inputs:list = None # 未計算のEVM入力データ
+    _pending_groups:list = None # 未計算の(入力データ番号, グループ行番号)
+
+    #
+    # constructor / destructor
+    #
+    def __init__(self, as_of_date:date, calendar:CommonCalendar, batch_size:int = 10000) -> None:
+        """コンストラクタ
+
+        Args:
+            as_of_date (date): 評価日
+            calendar (CommonCalendar): カレンダー
+            batch_size (int): 一括計算の単位(チケット数)
+        """
+        self._as_of_date = as_of_date
+        self._calendar = calendar
+        self._batch_size = batch_size
+        self._groups = {}
+        self._sums = np.zeros((0, len(self.SUM_COLUMNS)), dtype='float64')
+        self._counts = np.zeros(0, dtype='int64')
+        self._pending_inputs = []
+        self._pending_groups = []
+
+    #
+    # public methods
+    #
+    def add(self, input_data:CommonEVMInput, *keys) -> None:
+        """EVM入力データの追加
+
+        1件の入力データを複数のグループに同時に集計できる。
+        例: add(input_data, ('project', 'A'), ('version', 'A', '1.0'), ('assignee', 'taro'))
+
+        Args:
+            input_data (CommonEVMInput): EVM入力データ
+            *keys: 集計先のグループキー(ハッシュ可能な値)
+        """
+        position = len(self._pending_inputs)
+        self._pending_inputs.append(input_data)
+        for key in keys:
+            self._pending_groups.append((position, self._group_row(key)))
+        if len(self._pending_inputs) >= self._batch_size:
+            self.flush()
+
+    def add_many(self, records) -> None:
+        """EVM入力データの一括追加
+
+        Args:
+            records (iterable): (EVM入力データ, グループキーのリスト)の反復可能オブジェクト
+        """
+        for input_data, keys in records:
+            self.add(input_data, *keys)
+
+    def flush(self) -> None:
+        """未計算の入力データを計算して累積値に反映する
+        """
+        if not self._pending_inputs:
+            return
+        # チケット単位の値を一括計算
+        result = CommonEVM.calculate_batch(
+            CommonEVM._input_records(self._pending_inputs), self._as_of_date, self._calendar)
+        values = result[list(self.SUM_COLUMNS)].to_numpy()
+        # グループごとに累積
+        positions, rows = np.array(self._pending_groups, dtype='int64').reshape(-1, 2).T
+        np.add.at(self._sums, rows, values[positions])
+        np.add.at(self._counts, rows, 1)
+        self._pending_inputs = []
+        self._pending_groups = []
+
+    def get_result(self, key) -> dict:
+        """グループの集計結果取得
+
+        Args:
+            key: グループキー
+        Returns:
+            dict: 指標名 -> 値(count, pv, ev, ac, sv, cv, spi, cpi, bac, etc, eac, vac)
+        """
+        self.flush()
+        row = self._groups[key]
+        result = self._derive(self._sums[row:row + 1], self._counts[row:row + 1])
+        return {name: values[0].item() for name, values in result.items()}
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """全グループの集計結果取得
+
+        Returns:
+            pd.DataFrame: 集計結果(インデックスはグループキー、列はcountとCommonEVM.RESULT_COLUMNS)
+        """
+        self.flush()
+        size = len(self._groups)
+        index = pd.Index(list(self._groups.keys()), tupleize_cols=False, name='key')
+        return pd.DataFrame(self._derive(self._sums[:size], self._counts[:size]), index=index)
+
+    #
+    # protected methods
+    #
+    def _group_row(self, key) -> int:
+        """グループの累積値の行番号取得(未登録の場合は追加)
+
+        Args:
+            key: グループキー
+        Returns:
+            int: 累積値の行番号
+        """
+        row = self._groups.get(key)
+        if row is None:
+            row = len(self._groups)
+            self._groups[key] = row
+            if row >= len(self._counts):
+                # 累積値の領域は倍々で拡張する
+                capacity = max(16, row * 2)
+                self._sums = np.resize(self._sums, (capacity, len(self.SUM_COLUMNS)))
+                self._sums[row:] = 0
+                self._counts = np.resize(self._counts, capacity)
+                self._counts[row:] = 0
+        return row
+
+    def _derive(self, sums:np.ndarray, counts:np.ndarray) -> dict:
+        """累積値からの指標算出
+
+        Args:
+            sums (np.ndarray): 累積値(行数 × PV/EV/AC/BAC)
+            counts (np.ndarray): チケット数
+        Returns:
+            dict: 指標名 -> 値の配列
+        """
+        pv, ev, ac, bac = (CommonEVM._round_values(sums[:, column]) for column in range(len(self.SUM_COLUMNS)))
+        result = {'count': counts}
+        result.update(CommonEVM._derive_columns(pv, ev, ac, bac))
+        return result
@@ -0,0 +1,202 @@
+from .common_evm import CommonEVM
+from datetime import date
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+
+class CommonEVMSnapshotStore:
+    """EVMスナップショット保存クラス
+
+    評価日ごとのチケット単位のEVM計算結果を列単位のバイナリ(.npy)で追記保存する。
+    保存先は評価日ごとのディレクトリに、チケットID(昇順)と指標ごとのファイルを持つ。
+
+        store_dir/
+            2024-09-30/
+                ticket.npy  (int64, 昇順)
+                pv.npy, ev.npy, ... (float64)
+
+    参照時は対象期間のディレクトリのみを、必要な列だけメモリマップで読み込む。
+    """
+    # 列ファイル定義
+    TICKET_COLUMN:str = 'ticket' # チケットID列
+
+    # protected members
+    _store_dir:str = None # 保存先ディレクトリ
+    _dates:list = None # 保存済みの評価日(昇順)
+
+    #
+    # constructor / destructor
+    #
+    def __init__(self, store_dir:str) -> None:
+        """コンストラクタ
+
+        Args:
+            store_dir (str): 保存先ディレクトリ(存在しない場合は作成)
+        """
+        self._store_dir = store_dir
+        os.makedirs(store_dir, exist_ok=True)
+        self._dates = self._scan_dates()
+
+    #
+    # public methods
+    #
+    def get_dates(self) -> list:
+        """保存済みの評価日取得
+
+        Returns:
+            list: 評価日(date)のリスト(昇順)
+        """
+        return list(self._dates)
+
+    def append(self, as_of_date:date, tickets, results) -> None:
+        """スナップショットの追記
+
+        Args:
+            as_of_date (date): 評価日(保存済みの評価日は指定不可)
+            tickets (array-like): チケットID(整数)
+            results (np.ndarray | pd.DataFrame): EVM計算結果(CommonEVM.RESULT_DTYPE型の構造化配列、
+                                                 またはCommonEVM.RESULT_COLUMNSを列に持つ表)
+        """
+        as_of_date = pd.Timestamp(as_of_date).date()
+        if as_of_date in self._dates:
+            raise ValueError(f"snapshot already exists: {as_of_date}")
+        tickets = np.asarray(tickets, dtype='int64')
+        if len(tickets) != len(results):
+            raise ValueError(f"tickets/results length mismatch: {len(tickets)} != {len(results)}")
+        if len(np.unique(tickets)) != len(tickets):
+            raise ValueError("duplicate ticket id in snapshot")
+
+        # チケットID順に並べ替えて列ごとに保存(一時ディレクトリに書き込んでから置き換える)
+        order = np.argsort(tickets, kind='stable')
+        temp_dir = tempfile.mkdtemp(dir=self._store_dir, suffix='.tmp')
+        try:
+            np.save(os.path.join(temp_dir, self.TICKET_COLUMN + '.npy'), tickets[order])
+            for name in CommonEVM.RESULT_COLUMNS:
+                values = np.asarray(results[name], dtype='float64')
+                np.save(os.path.join(temp_dir, name + '.npy'), values[order])
+            os.replace(temp_dir, self._segment_dir(as_of_date))
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        self._dates = sorted(self._dates + [as_of_date])
+
+    def query(self, columns:tuple = CommonEVM.RESULT_COLUMNS, tickets = None, start_date:date = None, end_date:date = None) -> pd.DataFrame:
+        """スナップショットの参照
+
+        Args:
+            columns (tuple): 取得する指標(CommonEVM.RESULT_COLUMNSの部分集合)
+            tickets (array-like): 対象チケットID(指定なしの場合は全チケット)
+            start_date (date): 対象期間開始日(指定なしの場合は制限なし)
+            end_date (date): 対象期間終了日(指定なしの場合は制限なし)
+        Returns:
+            pd.DataFrame: 列はas_of_date, ticket, 指標(評価日・チケットID順)
+        """
+        columns = tuple(columns)
+        for name in columns:
+            if name not in CommonEVM.RESULT_COLUMNS:
+                raise ValueError(f"unknown column: {name}")
+        targets = np.unique(np.asarray(tickets, dtype='int64')) if tickets is not None else None
+
+        parts = {'as_of_date': [], self.TICKET_COLUMN: []}
+        parts.update({name: [] for name in columns})
+        for as_of_date in self._select_dates(start_date, end_date):
+            segment_dir = self._segment_dir(as_of_date)
+            segment_tickets = np.load(os.path.join(segment_dir, self.TICKET_COLUMN + '.npy'), mmap_mode='r')
+            if targets is None:
+                positions = slice(None)
+                found = np.asarray(segment_tickets)
+            else:
+                # チケットIDは昇順のため二分探索で位置を求める
+                positions = np.searchsorted(segment_tickets, targets)
+                positions = np.minimum(positions, max(len(segment_tickets) - 1, 0))
+                if len(segment_tickets) > 0:
+                    positions = positions[segment_tickets[positions] == targets]
+                else:
+                    positions = positions[:0]
+                found = np.asarray(segment_tickets[positions])
+            parts['as_of_date'].append(np.full(len(found), np.datetime64(as_of_date, 'D')))
+            parts[self.TICKET_COLUMN].append(found)
+            for name in columns:
+                values = np.load(os.path.join(segment_dir, name + '.npy'), mmap_mode='r')
+                parts[name].append(np.asarray(values[positions], dtype='float64'))
+
+        frame = {}
+        for name, values in parts.items():
+            frame[name] = np.concatenate(values) if values else np.array([], dtype=self._column_dtype(name))
+        return pd.DataFrame(frame)
+
+    def aggregate(self, tickets = None, start_date:date = None, end_date:date = None) -> pd.DataFrame:
+        """評価日ごとの集計(プロジェクト等のチケット集合単位の推移)
+
+        PV/EV/AC/BACを合計し、その他の指標はCommonEVMと同じ計算式で求める。
+
+        Args:
+            tickets (array-like): 対象チケットID(指定なしの場合は全チケット)
+            start_date (date): 対象期間開始日
+            end_date (date): 対象期間終了日
+        Returns:
+            pd.DataFrame: インデックスは評価日、列はcountとCommonEVM.RESULT_COLUMNS
+        """
+        frame = self.query(('pv', 'ev', 'ac', 'bac'), tickets, start_date, end_date)
+        sums = frame.groupby('as_of_date', sort=True).agg(
+            count=(self.TICKET_COLUMN, 'size'), pv=('pv', 'sum'), ev=('ev', 'sum'), ac=('ac', 'sum'), bac=('bac', 'sum'))
+        result = {'count': sums['count'].to_numpy()}
+        result.update(CommonEVM._derive_columns(*(CommonEVM._round_values(sums[name].to_numpy()) for name in ('pv', 'ev', 'ac', 'bac'))))
+        return pd.DataFrame(result, index=sums.index)
+
+    #
+    # protected methods
+    #
+    def _scan_dates(self) -> list:
+        """保存済みの評価日の走査
+
+        Returns:
+            list: 評価日(date)のリスト(昇順)
+        """
+        dates = []
+        for name in os.listdir(self._store_dir):
+            try:
+                dates.append(date.fromisoformat(name))
+            except ValueError:
+                # 評価日以外(一時ディレクトリ等)は対象外
+                continue
+        return sorted(dates)
+
+    def _select_dates(self, start_date:date, end_date:date) -> list:
+        """対象期間の評価日取得
+
+        Args:
+            start_date (date): 対象期間開始日
+            end_date (date): 対象期間終了日
+        Returns:
+            list: 評価日(date)のリスト(昇順)
+        """
+        start_date = pd.Timestamp(start_date).date() if start_date is not None else date.min
+        end_date = pd.Timestamp(end_date).date() if end_date is not None else date.max
+        return [as_of_date for as_of_date in self._dates if start_date <= as_of_date <= end_date]
+
+    def _segment_dir(self, as_of_date:date) -> str:
+        """評価日のディレクトリ名取得
+
+        Args:
+            as_of_date (date): 評価日
+        Returns:
+            str: ディレクトリ名
+        """
+        return os.path.join(self._store_dir, as_of_date.isoformat())
+
+    def _column_dtype(self, name:str) -> str:
+        """列の型取得
+
+        Args:
+            name (str): 列名
+        Returns:
+            str: 型
+        """
+        if name == 'as_of_date':
+            return 'datetime64[D]'
+        if name == self.TICKET_COLUMN:
+            return 'int64'
+        return 'float64'
@@ -1,29 +1,133 @@
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import json
+import multiprocessing
 import shutil
+import signal
+import threading
+import time
+
+@dataclass
+class CommonProgressStats:
+    """進捗統計
+    """
+    total: int = 0  # 総数
+    count: int = 0  # 処理数(完了時に総数へ補完した分は含めない)
+    start_time: datetime = None  # 開始時刻
+    end_time: datetime = None  # 終了時刻(完了前はNone)
+    elapsed: float = 0.0  # 経過時間(秒)
+    rate: float = 0.0  # 平均処理速度(件/秒)
+    ema_rate: float = 0.0  # 指数平滑化した処理速度(件/秒)
+    peak_rate: float = 0.0  # 最大処理速度(件/秒)
+    phases: list = field(default_factory=list)  # タスクメッセージごとの処理時間(task_msg, start_time, duration, count)
+
+    def to_dict(self) -> dict:
+        """辞書への変換(時刻はISO形式の文字列)
+        Returns:
+            dict: 進捗統計
+        """
+        result = asdict(self)
+        for name in ('start_time', 'end_time'):
+            result[name] = result[name].isoformat() if result[name] is not None else None
+        for phase in result['phases']:
+            phase['start_time'] = phase['start_time'].isoformat()
+        return result
+
+    def to_json(self, indent: int = 2) -> str:
+        """JSON文字列への変換
+        Args:
+            indent (int): インデント
+        Returns:
+            str: JSON文字列
+        """
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
 
 class CommonProgress:
     """共通進捗表示クラス
+
+    update()は現在数・メッセージの更新のみを行い、表示は最小表示間隔(秒)と
+    最小進捗率差(%)の条件を満たした場合に限り行う。complete()は常に最終状態を表示する。
+    処理速度は表示時に計測し、タスクメッセージの変更ごとの処理時間とともにget_stats()で取得できる。
     """
+    # 端末の横幅の再取得間隔(秒)
+    COLUMNS_REFRESH_INTERVAL: float = 1.0
+    # 処理速度の計測間隔(秒)
+    RATE_SAMPLE_INTERVAL: float = 0.1
+    # 処理速度の指数平滑化係数
+    RATE_SMOOTHING: float = 0.3
+
     # protected members
     _total: int = 0  # 総数
     _current: int = 0  # 現在数
     _task_msg: str = ""  # タスクメッセージ
     _status_msg: str = ""  # 状態メッセージ
     _display_type: int = 0  # 表示タイプ
+    _min_interval: float = 0.0  # 最小表示間隔(秒)
+    _min_percent: float = 0.0  # 最小進捗率差(%)
+    _next_display: float = 0.0  # 次に表示可能な時刻(time.monotonic)
+    _displayed_percent: float = -1.0  # 前回表示時の進捗率(%)
+    _columns: int = 0  # 端末の横幅(キャッシュ)
+    _columns_expire: float = 0.0  # 端末の横幅の有効期限(time.monotonic)
+    _columns_resize: int = 0  # 端末の横幅取得時のリサイズ回数
+    _stats_path: str = None  # 完了時の進捗統計の保存先(JSON)
+    _started: float = 0.0  # 開始時刻(time.monotonic)
+    _start_time: datetime = None  # 開始時刻
+    _end_time: datetime = None  # 終了時刻
+    _ended: float = None  # 終了時刻(time.monotonic)
+    _end_count: int = 0  # 完了時点の処理数(総数へ補完する前の現在数)
+    _sample_time: float = 0.0  # 前回の処理速度計測時刻(time.monotonic)
+    _sample_count: int = 0  # 前回の処理速度計測時の現在数
+    _ema_rate: float = None  # 指数平滑化した処理速度(件/秒)
+    _peak_rate: float = 0.0  # 最大処理速度(件/秒)
+    _phases: list = None  # 終了したタスクごとの処理時間
+    _phase_started: float = 0.0  # 現在のタスクの開始時刻(time.monotonic)
+    _phase_start_time: datetime = None  # 現在のタスクの開始時刻
+    _phase_count: int = 0  # 現在のタスクの開始時の現在数
+
+    # 端末リサイズ(SIGWINCH)の検知
+    _resize_count: int = 0  # リサイズ回数
+    _resize_handler_installed: bool = False  # シグナルハンドラ登録済みか
 
     #
     # constructor / destructor
     #
-    def __init__(self, total: int, task_msg: str = "", status_msg: str = "", display_type: int = 0) -> None:
+    def __init__(self, total: int, task_msg: str = "", status_msg: str = "", display_type: int = 0,
+                 min_interval: float = 0.1, min_percent: float = 0.0, stats_path: str = None) -> None:
         """コンストラクタ
         Args:
             total (int): 総数
             task_msg (str): タスクメッセージ
             status_msg (str): 状態メッセージ
-            display_type (int): 表示タイプ (0:タイプ01)
+            display_type (int): 表示タイプ (0:タイプ01, 1:タイプ02(処理速度・経過時間・残り時間付き))
+            min_interval (float): 最小表示間隔(秒、0の場合は時間による制限なし)
+            min_percent (float): 最小進捗率差(%、0の場合は進捗率による制限なし)
+            stats_path (str): 完了時の進捗統計の保存先(JSON、指定なしの場合は保存しない)
         """
         self._total = total
         self._current = 0
         self._display_type = display_type
+        self._min_interval = min_interval
+        self._min_percent = min_percent
+        self._next_display = 0.0
+        self._displayed_percent = -1.0
+        self._columns = 0
+        self._columns_expire = 0.0
+        self._columns_resize = 0
+        self._stats_path = stats_path
+        self._started = time.monotonic()
+        self._start_time = datetime.now()
+        self._end_time = None
+        self._ended = None
+        self._end_count = 0
+        self._sample_time = self._started
+        self._sample_count = 0
+        self._ema_rate = None
+        self._peak_rate = 0.0
+        self._phases = []
+        self._phase_started = self._started
+        self._phase_start_time = self._start_time
+        self._phase_count = 0
+        self._install_resize_handler()
         self.update(current=0, task_msg=task_msg, status_msg=status_msg)
 
     #
@@ -36,36 +140,190 @@ class CommonProgress:
             task_msg (str): タスクメッセージ
             status_msg (str): 状態メッセージ
         """
-        # 情報更新
+        # 情報更新(タスクが変わる場合は現在数の更新前に切り替える)
+        if task_msg and task_msg != self._task_msg:
+            self._change_phase(task_msg)
         self._current = current if current >= 0 else (self._current + 1)
-        self._task_msg = task_msg if task_msg else self._task_msg
-        self._status_msg = status_msg if status_msg else self._status_msg
-        # 表示更新
+        if status_msg:
+            self._status_msg = status_msg
+        # 表示更新(表示間隔・進捗率差を満たす場合のみ)
+        now = time.monotonic()
+        if now < self._next_display:
+            return
+        if self._min_percent > 0 and 0 <= self._displayed_percent:
+            if abs(self._get_percent() - self._displayed_percent) < self._min_percent:
+                return
+        self._next_display = now + self._min_interval
         self.display()
-    
+
     def complete(self, status_msg: str = "Completed") -> None:
         """進捗完了処理
         Args:
             status_msg (str): 状態メッセージ
         """
-        # 最終更新
-        self.update(current=self._total, status_msg=status_msg)
+        # 進捗統計の確定(総数へ補完する前の処理数で処理速度・タスクの処理数を確定)
+        if self._ended is None:
+            # 計測間隔に満たない短い処理でも処理速度を記録
+            self._sample_rate(force=self._ema_rate is None)
+            self._change_phase(self._task_msg)
+            self._ended = time.monotonic()
+            self._end_time = datetime.now()
+            self._end_count = self._current
+        # 最終更新(表示間隔によらず表示)
+        self._current = self._total
+        if status_msg:
+            self._status_msg = status_msg
+        self.display()
         # 改行表示(完了時)
         print()
+        # 進捗統計の保存
+        if self._stats_path is not None:
+            with open(self._stats_path, 'w', encoding='utf-8') as f:
+                f.write(self.get_stats().to_json())
+
+    def get_stats(self) -> CommonProgressStats:
+        """進捗統計取得
+        Returns:
+            CommonProgressStats: 進捗統計(呼び出し時点の値)
+        """
+        elapsed = (self._ended if self._ended is not None else time.monotonic()) - self._started
+        count = self._end_count if self._ended is not None else self._current
+        phases = [dict(phase) for phase in self._phases]
+        if self._ended is None:
+            # 実行中のタスク
+            phases.append(self._get_phase(time.monotonic()))
+        return CommonProgressStats(
+            total=self._total,
+            count=count,
+            start_time=self._start_time,
+            end_time=self._end_time,
+            elapsed=elapsed,
+            rate=count / elapsed if elapsed > 0 else 0.0,
+            ema_rate=self._ema_rate if self._ema_rate is not None else 0.0,
+            peak_rate=self._peak_rate,
+            phases=phases)
 
     def display(self) -> None:
         """進捗表示
         """
+        self._displayed_percent = self._get_percent()
+        if self._ended is None:
+            # 完了後は計測しない(総数への補完分を処理速度に含めない)
+            self._sample_rate()
         # 表示タイプによる分岐
         match self._display_type:
             case 0:
                 self._show_type01()
+            case 1:
+                self._show_type02()
             case _:
                 pass
 
     #
     # protected methods
     #
+    def _get_percent(self) -> float:
+        """進捗率取得
+        Returns:
+            float: 進捗率(%)
+        """
+        return (self._current / self._total) * 100 if self._total > 0 else 100.0
+
+    def _sample_rate(self, force: bool = False) -> None:
+        """処理速度の計測(前回の計測からRATE_SAMPLE_INTERVAL秒以上経過した場合のみ)
+        Args:
+            force (bool): True=経過時間によらず計測
+        """
+        now = time.monotonic()
+        interval = now - self._sample_time
+        if interval <= 0 or (interval < self.RATE_SAMPLE_INTERVAL and not force):
+            return
+        rate = max(self._current - self._sample_count, 0) / interval
+        if self._ema_rate is None:
+            self._ema_rate = rate
+        else:
+            self._ema_rate = self.RATE_SMOOTHING * rate + (1 - self.RATE_SMOOTHING) * self._ema_rate
+        self._peak_rate = max(self._peak_rate, rate)
+        self._sample_time = now
+        self._sample_count = self._current
+
+    def _change_phase(self, task_msg: str) -> None:
+        """タスクの切り替え(現在のタスクの処理時間を記録)
+        Args:
+            task_msg (str): 新しいタスクメッセージ
+        """
+        now = time.monotonic()
+        if self._task_msg or self._current > self._phase_count:
+            self._phases.append(self._get_phase(now))
+        self._task_msg = task_msg
+        self._phase_started = now
+        self._phase_start_time = datetime.now()
+        self._phase_count = self._current
+
+    def _get_phase(self, now: float) -> dict:
+        """現在のタスクの処理時間取得
+        Args:
+            now (float): 現在時刻(time.monotonic)
+        Returns:
+            dict: task_msg, start_time, duration(秒), count(処理数)
+        """
+        return {
+            'task_msg': self._task_msg,
+            'start_time': self._phase_start_time,
+            'duration': now - self._phase_started,
+            'count': self._current - self._phase_count,
+        }
+
+    def _format_seconds(self, seconds: float) -> str:
+        """時間の整形
+        Args:
+            seconds (float): 秒数
+        Returns:
+            str: [h:]mm:ss形式の文字列(Noneの場合は"--:--")
+        """
+        if seconds is None:
+            return "--:--"
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02}:{seconds:02}" if hours else f"{minutes:02}:{seconds:02}"
+
+    def _get_columns(self) -> int:
+        """端末の横幅取得(一定間隔または端末リサイズ時のみ再取得)
+        Returns:
+            int: 端末の横幅
+        """
+        now = time.monotonic()
+        if now >= self._columns_expire or self._columns_resize != CommonProgress._resize_count:
+            self._columns, _ = shutil.get_terminal_size(fallback=(100, 24))
+            self._columns_expire = now + self.COLUMNS_REFRESH_INTERVAL
+            self._columns_resize = CommonProgress._resize_count
+        return self._columns
+
+    @classmethod
+    def _install_resize_handler(cls) -> None:
+        """端末リサイズ(SIGWINCH)のシグナルハンドラ登録
+
+        SIGWINCHが使用可能で、メインスレッドから呼ばれ、
+        他のハンドラが登録されていない場合のみ登録する。
+        """
+        if cls._resize_handler_installed or not hasattr(signal, 'SIGWINCH'):
+            return
+        if threading.current_thread() is not threading.main_thread():
+            return
+        try:
+            if signal.getsignal(signal.SIGWINCH) not in (signal.SIG_DFL, None):
+                return
+            signal.signal(signal.SIGWINCH, cls._on_resize)
+        except (ValueError, OSError):
+            return
+        CommonProgress._resize_handler_installed = True
+
+    @staticmethod
+    def _on_resize(signum, frame) -> None:
+        """端末リサイズ時の処理(横幅の再取得を要求)
+        """
+        CommonProgress._resize_count += 1
+
     def _show_type01(self):
         """タイプ01の進捗表示
 
@@ -73,7 +331,7 @@ class CommonProgress:
         [#########################-------------------------] 50% | Task Message : Status Message
         """
         # 横幅計算
-        cols, _ = shutil.get_terminal_size(fallback=(100, 24))
+        cols = self._get_columns()
         width = cols - 1
         # 進捗率計算
         ratio = int((self._current / self._total) * 100) if self._total > 0 else 100
@@ -84,3 +342,223 @@ class CommonProgress:
         display_bar = '[' + '#' * current_block + '-' * (display_block_num - current_block) + ']'
         display_output = f"\r{display_bar} {ratio:3}% | {self._task_msg} : {self._status_msg}"
         print(f"{display_output[:width]:<{width}}", end="", flush=True)
+
+
+    def _show_type02(self):
+        """タイプ02の進捗表示(処理速度・経過時間・残り時間付き)
+
+        表示形式は以下の通り(処理速度は指数平滑化した値、残り時間はその処理速度から算出)
+        [################-----------------]  50% 1234.5/s 00:12<00:12 | Task Message : Status Message
+        """
+        # 横幅計算
+        cols = self._get_columns()
+        width = cols - 1
+        # 進捗率計算
+        ratio = int((self._current / self._total) * 100) if self._total > 0 else 100
+        # 表示ブロック数計算
+        display_block_num = 33
+        current_block = int((ratio * display_block_num) / 100)
+        # 処理速度・時間計算
+        rate = self._ema_rate if self._ema_rate is not None else 0.0
+        elapsed = time.monotonic() - self._started
+        remaining = (self._total - self._current) / rate if rate > 0 else (0.0 if self._current >= self._total else None)
+        # 進捗表示
+        display_bar = '[' + '#' * current_block + '-' * (display_block_num - current_block) + ']'
+        display_time = f"{self._format_seconds(elapsed)}<{self._format_seconds(remaining)}"
+        display_output = f"\r{display_bar} {ratio:3}% {rate:.1f}/s {display_time} | {self._task_msg} : {self._status_msg}"
+        print(f"{display_output[:width]:<{width}}", end="", flush=True)
+
+class CommonProgressCounter:
+    """進捗カウンタ(ワーカーからの加算用)
+
+    スレッド用(shared=False)はスレッドごとの加算値をロックなしで加算し、参照時に合計する。
+    プロセス用(shared=True)はmultiprocessing.Valueで共有し、ワーカープロセスへは
+    ProcessPoolExecutorのinitargs等(プロセス起動時の引数)で渡す。
+    """
+    # protected members
+    _shared = None  # プロセス間共有値(プロセス用)
+    _cells: list = None  # スレッドごとの加算値(スレッド用)
+    _cells_lock: threading.Lock = None  # 加算値リスト操作用ロック
+    _local: threading.local = None  # スレッドごとの加算値の参照
+
+    #
+    # constructor / destructor
+    #
+    def __init__(self, shared: bool = False) -> None:
+        """コンストラクタ
+        Args:
+            shared (bool): True=プロセス間で共有, False=スレッド間のみ
+        """
+        self._shared = multiprocessing.Value('q', 0) if shared else None
+        self._cells = []
+        self._cells_lock = threading.Lock()
+        self._local = threading.local()
+
+    def __getstate__(self) -> dict:
+        if self._shared is None:
+            raise TypeError("CommonProgressCounter(shared=False) cannot be sent to another process")
+        return {'_shared': self._shared}
+
+    def __setstate__(self, state: dict) -> None:
+        self._shared = state['_shared']
+
+    #
+    # public methods
+    #
+    def add(self, count: int = 1) -> None:
+        """加算
+        Args:
+            count (int): 加算数
+        """
+        if self._shared is not None:
+            with self._shared.get_lock():
+                self._shared.value += count
+            return
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._local.cell = [0]
+            with self._cells_lock:
+                self._cells.append(cell)
+        cell[0] += count
+
+    def get_value(self) -> int:
+        """合計値取得
+        Returns:
+            int: 合計値
+        """
+        if self._shared is not None:
+            return self._shared.value
+        with self._cells_lock:
+            return sum(cell[0] for cell in self._cells)
+
+class CommonProgressAggregator:
+    """並列処理用の進捗集計クラス
+
+    ワーカー(スレッド・プロセス)はCommonProgressCounterに加算のみを行い、
+    表示は専用の表示スレッドが一定間隔で合計値を読み取ってCommonProgressで行う。
+    """
+    # protected members
+    _counter: CommonProgressCounter = None  # 進捗カウンタ
+    _progress: CommonProgress = None  # 進捗表示
+    _interval: float = 0.0  # 表示間隔(秒)
+    _task_msg: str = ""  # 次回表示するタスクメッセージ
+    _status_msg: str = ""  # 次回表示する状態メッセージ
+    _lock: threading.Lock = None  # メッセージ操作用ロック
+    _stop: threading.Event = None  # 表示スレッドの停止要求
+    _thread: threading.Thread = None  # 表示スレッド
+
+    #
+    # constructor / destructor
+    #
+    def __init__(self, total: int, task_msg: str = "", status_msg: str = "", display_type: int = 0,
+                 interval: float = 0.1, shared: bool = False, stats_path: str = None) -> None:
+        """コンストラクタ
+        Args:
+            total (int): 総数
+            task_msg (str): タスクメッセージ
+            status_msg (str): 状態メッセージ
+            display_type (int): 表示タイプ (0:タイプ01, 1:タイプ02(処理速度・経過時間・残り時間付き))
+            interval (float): 表示間隔(秒)
+            shared (bool): True=ワーカープロセスから加算, False=ワーカースレッドから加算
+            stats_path (str): 完了時の進捗統計の保存先(JSON、指定なしの場合は保存しない)
+        """
+        self._counter = CommonProgressCounter(shared)
+        self._progress = CommonProgress(total, task_msg, status_msg, display_type, min_interval=0, stats_path=stats_path)
+        self._interval = interval
+        self._task_msg = ""
+        self._status_msg = ""
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self) -> 'CommonProgressAggregator':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.complete()
+        else:
+            # 異常終了時は途中の状態を表示して終了
+            self._stop_thread()
+            self._render()
+            print()
+
+    #
+    # public methods
+    #
+    def get_counter(self) -> CommonProgressCounter:
+        """進捗カウンタ取得(ワーカーへ渡す)
+        Returns:
+            CommonProgressCounter: 進捗カウンタ
+        """
+        return self._counter
+
+    def add(self, count: int = 1) -> None:
+        """加算(ワーカースレッドから呼び出し可)
+        Args:
+            count (int): 加算数
+        """
+        self._counter.add(count)
+
+    def set_message(self, task_msg: str = "", status_msg: str = "") -> None:
+        """メッセージ更新(次回の表示に反映)
+        Args:
+            task_msg (str): タスクメッセージ
+            status_msg (str): 状態メッセージ
+        """
+        with self._lock:
+            if task_msg:
+                self._task_msg = task_msg
+            if status_msg:
+                self._status_msg = status_msg
+
+    def get_stats(self) -> CommonProgressStats:
+        """進捗統計取得
+        Returns:
+            CommonProgressStats: 進捗統計(呼び出し時点の値)
+        """
+        return self._progress.get_stats()
+
+    def start(self) -> None:
+        """表示スレッドの開始
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='CommonProgressAggregator', daemon=True)
+            self._thread.start()
+
+    def complete(self, status_msg: str = "Completed") -> None:
+        """進捗完了処理(表示スレッドを停止し、最終状態を表示)
+        Args:
+            status_msg (str): 状態メッセージ
+        """
+        self._stop_thread()
+        self._render()
+        self._progress.complete(status_msg)
+
+    #
+    # protected methods
+    #
+    def _run(self) -> None:
+        """表示スレッドの処理
+        """
+        while not self._stop.wait(self._interval):
+            self._render()
+
+    def _render(self) -> None:
+        """合計値とメッセージの表示への反映
+        """
+        with self._lock:
+            task_msg, status_msg = self._task_msg, self._status_msg
+            self._task_msg, self._status_msg = "", ""
+        self._progress.update(current=self._counter.get_value(), task_msg=task_msg, status_msg=status_msg)
+
+    def _stop_thread(self) -> None:
+        """表示スレッドの停止
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
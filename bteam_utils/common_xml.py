@@ -1,7 +1,420 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+import atexit
+import bz2
+import gzip
+import io
+import itertools
+import lzma
+import os
+import queue
+import re
+import shutil
+import threading
 import xml.etree.ElementTree as Et
 from xml.dom import minidom
+import numpy as np
+import pandas as pd
+
+class CommonXMLWriter:
+    """XML逐次書き込みクラス
+
+    開始タグ・テキスト・終了タグを順に受け取り、minidomのtoprettyxml()と同じ書式で
+    ファイルへ直接書き込む。DOMを構築しないため、メモリ使用量は要素の深さ程度で済む。
+    XMLとして不正なタグ名・文字、文字列以外の値は書き込まずに例外とする。
+    """
+    INVALID_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]') # XML 1.0で使用できない文字
+    NAME_PATTERN = re.compile(r'[^\W\d][\w.\-]*\Z') # 逐次書き込みで扱うタグ名・属性名(名前空間接頭辞なし)
+
+    # protected members
+    _fout = None # 出力先
+    _indent:str = "" # インデント文字列
+    _newl:str = "" # 改行文字列
+    _stack:list = None # 書き込み中の要素([タグ, ブロック形式か, テキスト]のリスト)
+    _buffer:list = None # 書き込みバッファ
+    _buffer_size:int = 0 # バッファの最大要素数
+    _validate:bool = True # タグ名・文字の確認を行うか
+    _names:set = None # 確認済みのタグ名・属性名
+    _text_escapes:tuple = () # テキストのエスケープ規則(実行中のminidomから決定)
+    _attrib_escapes:tuple = () # 属性値のエスケープ規則(実行中のminidomから決定)
+    _compatible:bool = False # minidomと同じ出力になるか(import時に確認)
+
+    #
+    # constructor / destructor
+    #
+    def __init__(self, fout, indent:str = "\t", newl:str = "\n", buffer_size:int = 8192, validate:bool = True) -> None:
+        """コンストラクタ
+
+        Args:
+            fout: 出力先(テキストモードのファイル)
+            indent (str): インデント文字列
+            newl (str): 改行文字列
+            buffer_size (int): 書き込みバッファの最大要素数
+            validate (bool): True=タグ名・文字を確認, False=確認しない(確認済みの場合)
+        """
+        self._fout = fout
+        self._indent = indent
+        self._newl = newl
+        self._stack = []
+        self._buffer = []
+        self._buffer_size = buffer_size
+        self._validate = validate
+        self._names = set()
+
+    #
+    # public methods
+    #
+    @classmethod
+    def matches_minidom(cls) -> bool:
+        """minidomのtoprettyxml()と同じ出力になるかの判定
+
+        Returns:
+            bool: True=同じ出力, False=異なる(minidomで整形する必要あり)
+        """
+        return cls._compatible
+
+    def start_document(self) -> None:
+        """XML宣言の書き込み
+        """
+        self._write('<?xml version="1.0" ?>' + self._newl)
+
+    def start(self, tag:str, attrib:dict = None) -> None:
+        """開始タグの書き込み
+
+        Args:
+            tag (str): タグ名
+            attrib (dict): 属性
+        """
+        if self._validate:
+            self._check_name(tag)
+            if attrib:
+                for name, value in attrib.items():
+                    self._check_name(name)
+                    self._check_text(value)
+        if self._stack:
+            self._open_block(self._stack[-1])
+        pieces = [self._indent * len(self._stack), '<', tag]
+        if attrib:
+            for name, value in attrib.items():
+                pieces.append(' %s="%s"' % (name, self._escape(value, True)))
+        self._write(''.join(pieces))
+        self._stack.append([tag, False, []])
+
+    def data(self, text:str) -> None:
+        """テキストの書き込み
+
+        Args:
+            text (str): テキスト
+        """
+        if text is None:
+            return
+        if self._validate:
+            self._check_text(text)
+        if text and self._stack:
+            self._stack[-1][2].append(text)
+
+    def end(self, tag:str = None) -> None:
+        """終了タグの書き込み
+
+        Args:
+            tag (str): タグ名(指定した場合は開始タグとの対応を確認)
+        """
+        name, block, texts = self._stack.pop()
+        if tag is not None and tag != name:
+            raise ValueError(f"end tag mismatch: {tag} != {name}")
+        if block:
+            # 子要素を持つ場合
+            self._flush_text(texts, len(self._stack) + 1)
+            self._write(self._indent * len(self._stack) + '</' + name + '>' + self._newl)
+        elif texts:
+            # テキストのみを持つ場合
+            self._write('>' + self._escape(self._normalize(''.join(texts))) + '</' + name + '>' + self._newl)
+        else:
+            # 空要素
+            self._write('/>' + self._newl)
+
+    def element(self, tag:str, text:str = None, attrib:dict = None) -> None:
+        """子要素を持たない要素の書き込み
+
+        Args:
+            tag (str): タグ名
+            text (str): テキスト
+            attrib (dict): 属性
+        """
+        self.start(tag, attrib)
+        self.data(text)
+        self.end(tag)
+
+    def write_element(self, element:Et.Element) -> None:
+        """Elementツリーの書き込み(末尾テキストは対象外)
+
+        Args:
+            element (Et.Element): 書き込む要素
+        """
+        self.start(element.tag, element.attrib)
+        self.data(element.text)
+        for child in element:
+            self.write_element(child)
+            self.data(child.tail)
+        self.end(element.tag)
+
+    def flush(self) -> None:
+        """書き込みバッファの出力
+        """
+        if self._buffer:
+            self._fout.write(''.join(self._buffer))
+            self._buffer = []
+
+    def close(self) -> None:
+        """書き込み終了
+        """
+        if self._stack:
+            raise ValueError(f"unclosed element: {self._stack[-1][0]}")
+        self.flush()
+
+    #
+    # protected methods
+    #
+    def _open_block(self, entry:list) -> None:
+        """親要素をブロック形式(子要素を改行・インデントして出力)にする
+
+        Args:
+            entry (list): 親要素の[タグ, ブロック形式か, テキスト]
+        """
+        if not entry[1]:
+            self._write('>' + self._newl)
+            entry[1] = True
+        self._flush_text(entry[2], len(self._stack))
+
+    def _flush_text(self, texts:list, depth:int) -> None:
+        """子要素と並ぶテキストの書き込み
+
+        Args:
+            texts (list): テキスト(書き込み後に空にする)
+            depth (int): テキストの深さ
+        """
+        if texts:
+            self._write(self._escape(self._indent * depth + self._normalize(''.join(texts)) + self._newl))
+            texts.clear()
+
+    def _check_name(self, name:str) -> None:
+        """タグ名・属性名の確認
+
+        Args:
+            name (str): タグ名・属性名
+        """
+        if name in self._names:
+            return
+        if not isinstance(name, str):
+            raise TypeError(f"cannot serialize {name!r} (type {type(name).__name__})")
+        if not self.NAME_PATTERN.match(name):
+            raise ValueError(f"invalid XML name: {name!r}")
+        self._names.add(name)
+
+    def _check_text(self, text:str) -> None:
+        """テキスト・属性値の確認
+
+        Args:
+            text (str): テキスト・属性値
+        """
+        if not isinstance(text, str):
+            raise TypeError(f"cannot serialize {text!r} (type {type(text).__name__})")
+        match = self.INVALID_CHARS.search(text)
+        if match:
+            raise ValueError(f"invalid XML character: {match.group()!r}")
+
+    def _write(self, text:str) -> None:
+        """バッファへの書き込み
+
+        Args:
+            text (str): 書き込む文字列
+        """
+        self._buffer.append(text)
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def _escape(self, text:str, attrib:bool = False) -> str:
+        """文字列のエスケープ(実行中のminidomと同じ規則)
+
+        Args:
+            text (str): 対象文字列
+            attrib (bool): True=属性値, False=テキスト
+        Returns:
+            str: エスケープ後の文字列
+        """
+        for char, entity in (self._attrib_escapes if attrib else self._text_escapes):
+            if char in text:
+                text = text.replace(char, entity)
+        return text
+
+    def _normalize(self, text:str) -> str:
+        """テキストの改行の正規化(XMLパーサと同じ規則)
+
+        Args:
+            text (str): 対象文字列
+        Returns:
+            str: 正規化後の文字列
+        """
+        return text.replace("\r\n", "\n").replace("\r", "\n") if "\r" in text else text
+
+    @classmethod
+    def _probe_minidom(cls) -> None:
+        """実行中のminidomのエスケープ規則の確認
+
+        minidomはPythonのバージョンによってエスケープ規則が異なる(3.13以降はテキストの「"」を
+        エスケープせず、属性値の改行・タブを文字参照にする)ため、import時に一度だけ確認する。
+        確認した規則で書き込んだ結果がtoprettyxml()と一致しない場合は_compatibleをFalseにする。
+        """
+        specials = (("\"", "&quot;"), ("\r", "&#13;"), ("\n", "&#10;"), ("\t", "&#9;"))
+        document = minidom.Document()
+        node = document.createElement('p')
+        node.setAttribute('a', ''.join(char for char, _ in specials))
+        node.appendChild(document.createTextNode(''.join(char for char, _ in specials)))
+        probe = node.toxml()
+        attrib_part = probe[probe.index('"') + 1:probe.index('">')]
+        text_part = probe[probe.index('">') + 2:-len('</p>')]
+        base = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"))
+        cls._attrib_escapes = base + tuple(rule for rule in specials if rule[1] in attrib_part)
+        cls._text_escapes = base + tuple(rule for rule in specials if rule[1] in text_part)
+
+        # 特殊文字を含むツリーでtoprettyxml()と比較
+        value = '&<>"\'\r\n\t\r\n x'
+        root = Et.Element('r', {'a': value})
+        root.text = value
+        child = Et.SubElement(root, 'c', {'b': value})
+        child.text = value
+        child.tail = value
+        Et.SubElement(root, 'e')
+        buffer = io.StringIO()
+        writer = cls(buffer)
+        writer.start_document()
+        writer.write_element(root)
+        writer.close()
+        expected = minidom.parseString(Et.tostring(root, 'utf-8')).toprettyxml()
+        cls._compatible = buffer.getvalue() == expected
+
+CommonXMLWriter._probe_minidom()
+
+class CommonXMLBackgroundWriter:
+    """バックグラウンド書き込みクラス
+
+    書き込み処理を上限付きのキューに積み、専用スレッドで投入順に実行する。
+    キューが満杯の場合は投入側を待たせる(asyncioからはイベントループを止めずに待つ)。
+    close()を呼ばずにインタプリタが終了する場合も、終了時に投入済みの書き込み処理を完了させる。
+    """
+    # protected members
+    _queue:queue.Queue = None # 書き込み処理のキュー
+    _thread:threading.Thread = None # 書き込みスレッド
+    _lock:threading.Lock = None # スレッド起動・終了用ロック
+
+    #
+    # constructor / destructor
+    #
+    def __init__(self, max_queue:int = 8) -> None:
+        """コンストラクタ
+
+        Args:
+            max_queue (int): キューの最大件数
+        """
+        self._queue = queue.Queue(max_queue)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'CommonXMLBackgroundWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    #
+    # public methods
+    #
+    def submit(self, func, *args) -> Future:
+        """書き込み処理の投入(キューが満杯の場合は空くまで待つ)
+
+        Args:
+            func (callable): 書き込み処理
+            *args: 書き込み処理の引数
+        Returns:
+            Future: 書き込み処理の結果
+        """
+        future = Future()
+        self._start()
+        self._queue.put((future, func, args))
+        return future
+
+    async def submit_async(self, func, *args) -> asyncio.Future:
+        """書き込み処理の投入(asyncio用、キューが満杯の場合は空くまで待つ)
+
+        Args:
+            func (callable): 書き込み処理
+            *args: 書き込み処理の引数
+        Returns:
+            asyncio.Future: 書き込み処理の結果
+        """
+        future = Future()
+        job = (future, func, args)
+        self._start()
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            try:
+                await asyncio.to_thread(self._queue.put, job)
+            except asyncio.CancelledError:
+                # 投入待ちで取り消された場合は実行しない
+                future.cancel()
+                raise
+        return asyncio.wrap_future(future)
+
+    def close(self) -> None:
+        """投入済みの書き込み処理の完了を待って終了
+        """
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread.join()
+                self._thread = None
+                atexit.unregister(self.close)
+
+    #
+    # protected methods
+    #
+    def _start(self) -> None:
+        """書き込みスレッドの起動(未起動の場合)
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='CommonXMLBackgroundWriter', daemon=True)
+                self._thread.start()
+                # 終了時に投入済みの書き込み処理を完了させる
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        """書き込みスレッドの処理
+        """
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            future, func, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
 
 class CommonXML:
+    # CSV出力のバッチサイズ(行数)
+    CSV_BATCH_SIZE:int = 10000
+    # 非同期書き込みのキューの最大件数
+    ASYNC_QUEUE_SIZE:int = 8
+    # 拡張子 -> 圧縮形式
+    COMPRESSION_EXTENSIONS:dict = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.lzma': 'xz'}
+
+    # protected members
+    _writer:CommonXMLBackgroundWriter = None # 非同期書き込み用(初回の非同期書き込み時に作成)
+
     def __init__(self) -> None:
         """コンストラクタ
         """
@@ -12,6 +425,32 @@ class CommonXML:
         """
         pass
 
+    def open_file(self, file_path:str, mode:str = 'r', compression:str = 'infer', compresslevel:int = None, **kwargs):
+        """ファイルを開く(圧縮ファイルは読み書き時に逐次圧縮・展開)
+
+        Args:
+            file_path (str): ファイル名
+            mode (str): モード(open()と同じ)
+            compression (str): 圧縮形式("gzip", "bz2", "xz", None=非圧縮, "infer"=拡張子で判定)
+            compresslevel (int): 圧縮レベル(書き込み時のみ、指定なしの場合は各形式の既定値)
+            **kwargs: open()に渡す引数(encoding, newline等)
+        Returns:
+            ファイルオブジェクト
+        """
+        compression = self._get_compression(file_path, compression)
+        if compression is None:
+            return open(file_path, mode, **kwargs)
+        if 'b' not in mode and 't' not in mode:
+            mode += 't'
+        writing = 'r' not in mode
+        if compression == 'gzip':
+            return gzip.open(file_path, mode, compresslevel=compresslevel if writing and compresslevel is not None else 9, **kwargs)
+        if compression == 'bz2':
+            return bz2.open(file_path, mode, compresslevel=compresslevel if writing and compresslevel is not None else 9, **kwargs)
+        if compression == 'xz':
+            return lzma.open(file_path, mode, preset=compresslevel if writing else None, **kwargs)
+        raise ValueError(f"unknown compression: {compression}")
+
     def pretty_tree(self, element:Et.Element) -> None:
         """XMLデータの整形
 
@@ -21,45 +460,502 @@ class CommonXML:
         xml_string = minidom.parseString(Et.tostring(element, 'utf-8'))
         return(xml_string.toprettyxml())
 
-    def save_xml(self, element:Et.Element, outfile_path:str) -> None:
+    def save_xml(self, element:Et.Element, outfile_path:str, compression:str = 'infer', compresslevel:int = None) -> None:
         """XMLファイルの保存
 
         Args:
             element (Et.Element): rootのElement
             outfile_path (str): 保存ファイル名
+            compression (str): 圧縮形式(open_file()と同じ)
+            compresslevel (int): 圧縮レベル
         """
-        xml_string = self.pretty_tree(element)
-        with open(outfile_path, 'w', encoding='utf-8') as f:
-            f.write(xml_string)
+        if not self._is_plain_tree(element) or not CommonXMLWriter.matches_minidom():
+            # 名前空間・コメント等を含む場合、minidomと出力が異なる場合はminidomで整形
+            xml_string = self.pretty_tree(element)
+            with self.open_file(outfile_path, 'w', compression, compresslevel, encoding='utf-8') as f:
+                f.write(xml_string)
+            return
+        # 整形しながら直接書き込む(pretty_tree()と同じ出力)
+        with self.open_file(outfile_path, 'w', compression, compresslevel, encoding='utf-8') as f:
+            writer = CommonXMLWriter(f, validate=False) # _is_plain_tree()で確認済み
+            writer.start_document()
+            writer.write_element(element)
+            writer.close()
 
-    def save_csv(self, element:Et.Element, outfile_path:str, key_header:str, key_body:str) -> None:
+    def _is_plain_tree(self, element:Et.Element) -> bool:
+        """逐次書き込み可能なツリーかの判定
+
+        Args:
+            element (Et.Element): rootのElement
+        Returns:
+            bool: True=要素・属性・テキストのみで構成,
+                  False=名前空間・コメント・処理命令、不正な文字、文字列以外の値を含む
+                  (minidomで整形し、従来どおり例外とする)
+        """
+        invalid = CommonXMLWriter.INVALID_CHARS.search
+        valid_name = CommonXMLWriter.NAME_PATTERN.match
+        names = set() # 確認済みのタグ名・属性名
+        for node in element.iter():
+            tag = node.tag
+            if tag not in names:
+                if not isinstance(tag, str) or not valid_name(tag):
+                    return False
+                names.add(tag)
+            if node.attrib:
+                for name, value in node.attrib.items():
+                    if name not in names:
+                        if not isinstance(name, str) or not valid_name(name):
+                            return False
+                        names.add(name)
+                    if not isinstance(value, str) or invalid(value):
+                        return False
+            text = node.text
+            if text is not None and (not isinstance(text, str) or invalid(text)):
+                return False
+            text = node.tail
+            if text is not None and (not isinstance(text, str) or invalid(text)):
+                return False
+        return True
+
+    def save_csv(self, element:Et.Element, outfile_path:str, key_header:str, key_body:str, compression:str = 'infer', compresslevel:int = None) -> None:
         """XMLをCSVに変換
 
         Args:
             element (Et.Element): rootのElement
             key_header (str): Header部のname
             key_body (str): Body部のname
+            compression (str): 圧縮形式(open_file()と同じ)
+            compresslevel (int): 圧縮レベル
         """
         # Parse xml file
         root = element
 
         # Create csv file
-        with open(outfile_path, "w", encoding='utf-8-sig', newline='') as fout:
+        with self.open_file(outfile_path, "w", compression, compresslevel, encoding='utf-8-sig', newline='') as fout:
             # Write header
             header = root.find(key_header)
             fout.write(','.join(element.attrib["name"] for element in header) + '\n')
             tags = [element.tag for element in header]
 
             # Write tickets
-            tickets = root.findall(key_body)
-            for ticket in tickets:
-                row_data = []
-                for tag in tags:
-                    el = ticket.find(tag)
-                    el_text = el.text if el is not None else None
-
-                    if el_text is None or str(el_text) == "None":
-                        row_data.append('')
+            self._write_csv_rows(fout, root.iterfind(key_body), tags)
+
+    def convert_csv(self, infile_path:str, outfile_path:str, key_header:str, key_body:str, compression:str = 'infer', compresslevel:int = None) -> int:
+        """XMLファイルをCSVファイルに変換(逐次処理)
+
+        iterparseで読み込みながら1件ずつCSVに書き込み、処理済みの要素は解放するため、
+        ファイルサイズによらずメモリ使用量は一定となる。出力形式はsave_csv()と同じ。
+
+        Args:
+            infile_path (str): 読込ファイル名
+            outfile_path (str): 保存ファイル名
+            key_header (str): Header部のname(rootからのパス)
+            key_body (str): Body部のname(rootからのパス)
+            compression (str): 保存ファイルの圧縮形式(open_file()と同じ、読込ファイルは拡張子で判定)
+            compresslevel (int): 圧縮レベル
+        Returns:
+            int: 出力行数(チケット数)
+        """
+        with self.open_file(outfile_path, "w", compression, compresslevel, encoding='utf-8-sig', newline='') as fout:
+            elements = self._iter_elements(infile_path, key_header, key_body)
+            # Write header
+            header = next(elements)
+            fout.write(','.join(column.attrib["name"] for column in header) + '\n')
+            tags = [column.tag for column in header]
+
+            # Write tickets
+            return self._write_csv_rows(fout, elements, tags)
+
+    def save_xml_many(self, jobs, max_workers:int = None, compression:str = 'infer', compresslevel:int = None) -> None:
+        """複数のXMLファイルを並列に保存
+
+        Args:
+            jobs (iterable): (rootのElement, 保存ファイル名)の組
+            max_workers (int): スレッド数(指定なしの場合はThreadPoolExecutorの既定値)
+            compression (str): 圧縮形式(open_file()と同じ)
+            compresslevel (int): 圧縮レベル
+        """
+        with ThreadPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(self.save_xml, element, outfile_path, compression, compresslevel) for element, outfile_path in jobs]
+            for future in futures:
+                future.result()
+
+    def save_csv_many(self, jobs, key_header:str, key_body:str, max_workers:int = None, compression:str = 'infer', compresslevel:int = None) -> None:
+        """複数のCSVファイルを並列に保存(プロジェクト・トラッカーごとの出力等)
+
+        Args:
+            jobs (iterable): (rootのElement, 保存ファイル名)の組
+            key_header (str): Header部のname
+            key_body (str): Body部のname
+            max_workers (int): スレッド数(指定なしの場合はThreadPoolExecutorの既定値)
+            compression (str): 圧縮形式(open_file()と同じ)
+            compresslevel (int): 圧縮レベル
+        """
+        with ThreadPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(self.save_csv, element, outfile_path, key_header, key_body, compression, compresslevel)
+                       for element, outfile_path in jobs]
+            for future in futures:
+                future.result()
+
+    def save_csv_sharded(self, element:Et.Element, outfile_path:str, key_header:str, key_body:str, shards:int = 4,
+                         max_workers:int = None, merge:bool = False, compression:str = 'infer', compresslevel:int = None) -> list:
+        """Body部を分割して並列にCSV保存
+
+        Body部を文書順にshards個に分割し、分割ごとのファイルを並列に書き込む。
+        merge=Falseの場合、分割ファイルはそれぞれsave_csv()と同じ形式(BOM・ヘッダー付き)とする。
+        merge=Trueの場合、分割ファイルを連結してsave_csv()と同じ内容の1ファイルとする
+        (圧縮ファイルは圧縮済みのまま連結する)。
+
+        Args:
+            element (Et.Element): rootのElement
+            outfile_path (str): 保存ファイル名(分割ファイルは"名前.part000.csv"等)
+            key_header (str): Header部のname
+            key_body (str): Body部のname
+            shards (int): 分割数
+            max_workers (int): スレッド数(指定なしの場合はThreadPoolExecutorの既定値)
+            merge (bool): True=1ファイルに連結, False=分割ファイルのまま
+            compression (str): 圧縮形式(open_file()と同じ)
+            compresslevel (int): 圧縮レベル
+        Returns:
+            list: 保存したファイル名
+        """
+        compression = self._get_compression(outfile_path, compression)
+        header = element.find(key_header)
+        header_line = ','.join(column.attrib["name"] for column in header) + '\n'
+        tags = [column.tag for column in header]
+        tickets = element.findall(key_body)
+        size = max(-(-len(tickets) // max(shards, 1)), 1)
+        parts = [tickets[head:head + size] for head in range(0, len(tickets), size)] or [[]]
+
+        if merge:
+            part_paths = [f"{outfile_path}.part{number:03d}" for number in range(len(parts) + 1)]
+        else:
+            base, ext = self._split_ext(outfile_path)
+            part_paths = [f"{base}.part{number:03d}{ext}" for number in range(len(parts))]
+
+        def write_part(part_path:str, rows:list, first_line:str) -> None:
+            encoding = 'utf-8-sig' if first_line is not None else 'utf-8'
+            with self.open_file(part_path, "w", compression, compresslevel, encoding=encoding, newline='') as fout:
+                if first_line is not None:
+                    fout.write(first_line)
+                self._write_csv_rows(fout, rows, tags)
+
+        try:
+            with ThreadPoolExecutor(max_workers) as executor:
+                if merge:
+                    # 先頭はBOM・ヘッダーのみ、以降は行のみ
+                    futures = [executor.submit(write_part, part_paths[0], [], header_line)]
+                    futures += [executor.submit(write_part, part_path, rows, None) for part_path, rows in zip(part_paths[1:], parts)]
+                else:
+                    futures = [executor.submit(write_part, part_path, rows, header_line) for part_path, rows in zip(part_paths, parts)]
+                for future in futures:
+                    future.result()
+            if not merge:
+                return part_paths
+            with open(outfile_path, 'wb') as fout:
+                for part_path in part_paths:
+                    with open(part_path, 'rb') as fin:
+                        shutil.copyfileobj(fin, fout, 1024 * 1024)
+            return [outfile_path]
+        finally:
+            if merge:
+                for part_path in part_paths:
+                    if os.path.exists(part_path):
+                        os.remove(part_path)
+
+    async def save_xml_async(self, element:Et.Element, outfile_path:str, compression:str = 'infer', compresslevel:int = None, wait:bool = True):
+        """XMLファイルの保存(非同期)
+
+        整形・書き込みはバックグラウンドの書き込みスレッドで行い、イベントループは止めない。
+        書き込み待ちがASYNC_QUEUE_SIZE件を超える場合は、空くまで投入を待つ。
+        書き込み完了までelementを変更しないこと。
+
+        Args:
+            element (Et.Element): rootのElement
+            outfile_path (str): 保存ファイル名
+            compression (str): 圧縮形式(open_file()と同じ)
+            compresslevel (int): 圧縮レベル
+            wait (bool): True=書き込み完了まで待つ, False=投入後に書き込み完了のFutureを返す
+        Returns:
+            asyncio.Future: wait=Falseの場合、書き込み完了のFuture
+        """
+        future = await self._get_writer().submit_async(self.save_xml, element, outfile_path, compression, compresslevel)
+        return await future if wait else future
+
+    async def save_csv_async(self, element:Et.Element, outfile_path:str, key_header:str, key_body:str,
+                             compression:str = 'infer', compresslevel:int = None, wait:bool = True):
+        """XMLをCSVに変換(非同期)
+
+        save_xml_async()と同様に、バックグラウンドの書き込みスレッドで変換・書き込みを行う。
+
+        Args:
+            element (Et.Element): rootのElement
+            outfile_path (str): 保存ファイル名
+            key_header (str): Header部のname
+            key_body (str): Body部のname
+            compression (str): 圧縮形式(open_file()と同じ)
+            compresslevel (int): 圧縮レベル
+            wait (bool): True=書き込み完了まで待つ, False=投入後に書き込み完了のFutureを返す
+        Returns:
+            asyncio.Future: wait=Falseの場合、書き込み完了のFuture
+        """
+        future = await self._get_writer().submit_async(self.save_csv, element, outfile_path, key_header, key_body, compression, compresslevel)
+        return await future if wait else future
+
+    def close_writer(self) -> None:
+        """非同期書き込みの完了を待って書き込みスレッドを終了
+        """
+        if self._writer is not None:
+            self._writer.close()
+
+    def load_columns(self, source, key_header:str, key_body:str, dtypes:dict = None, as_frame:bool = True, compression:str = 'infer'):
+        """XMLから列単位のデータを作成
+
+        save_csv()で出力したCSVを読み込むのと同じ列(ヘッダーのname)で、
+        CSVを経由せずにDataFrameまたは列名 -> np.ndarrayの辞書を作成する。
+
+        Args:
+            source (Et.Element | str): rootのElement、または読込ファイル名
+            key_header (str): Header部のname
+            key_body (str): Body部のname
+            dtypes (dict): 列名 -> 型(指定なしの列は文字列(object)、値なしはNone)
+                           日付はdatetime64[D]等、数値はfloat64等、boolは"true"/"1"/"yes"をTrueとする
+            as_frame (bool): True=DataFrame, False=列名 -> np.ndarrayの辞書
+            compression (str): 読込ファイルの圧縮形式(open_file()と同じ)
+        Returns:
+            pd.DataFrame | dict: 列単位のデータ
+        """
+        if isinstance(source, Et.Element):
+            header = source.find(key_header)
+            if header is None:
+                raise ValueError(f"header not found: {key_header}")
+            return self._build_columns(header, source.iterfind(key_body), dtypes, as_frame, 0)
+        return next(self.iter_columns(source, key_header, key_body, dtypes, as_frame, chunk_size=None, compression=compression))
+
+    def iter_columns(self, infile_path:str, key_header:str, key_body:str, dtypes:dict = None, as_frame:bool = True, chunk_size:int = 10000, compression:str = 'infer'):
+        """XMLファイルから列単位のデータをチャンクごとに逐次作成
+
+        iterparseで読み込み、処理済みの要素は解放するため、
+        メモリ使用量はチャンクの大きさによる。
+
+        Args:
+            infile_path (str): 読込ファイル名
+            key_header (str): Header部のname
+            key_body (str): Body部のname
+            dtypes (dict): 列名 -> 型(load_columns()と同じ)
+            as_frame (bool): True=DataFrame, False=列名 -> np.ndarrayの辞書
+            chunk_size (int): 1チャンクあたりのチケット数(Noneの場合は全件を1チャンクとする)
+            compression (str): 読込ファイルの圧縮形式(open_file()と同じ)
+        Yields:
+            pd.DataFrame | dict: 列単位のデータ(DataFrameのインデックスはファイル先頭からの通番)
+        """
+        elements = self._iter_elements(infile_path, key_header, key_body, compression)
+        header = next(elements)
+        offset = 0
+        while True:
+            tickets = list(itertools.islice(elements, chunk_size))
+            if tickets or offset == 0:
+                yield self._build_columns(header, tickets, dtypes, as_frame, offset)
+            offset += len(tickets)
+            if chunk_size is None or len(tickets) < chunk_size:
+                break
+
+    def _iter_elements(self, infile_path:str, key_header:str, key_body:str, compression:str = 'infer'):
+        """XMLファイルからHeader部とBody部の要素を逐次取得
+
+        最初にHeader部、続いてBody部を文書順に返す(key_headerがNoneの場合はBody部のみ)。
+        Body部は次の要素を取得した時点で親要素から切り離して解放する。
+
+        Args:
+            infile_path (str): 読込ファイル名
+            key_header (str): Header部のname(rootからのパス、Noneの場合はHeader部を読まない)
+            key_body (str): Body部のname(rootからのパス)
+            compression (str): 読込ファイルの圧縮形式(open_file()と同じ)
+        Yields:
+            Et.Element: Header部、Body部の要素
+        """
+        header_path = self._split_path(key_header) if key_header is not None else None
+        body_path = self._split_path(key_body)
+        header = None
+        waiting = header_path is not None # Header部の読込待ちか
+        pending = [] # Header部より前に現れたBody部
+        path = [] # rootからのタグのパス
+        parents = [] # 読込中の要素
+        with self.open_file(infile_path, 'rb', compression) as fin:
+            for event, element in Et.iterparse(fin, events=('start', 'end')):
+                if event == 'start':
+                    parents.append(element)
+                    path.append(element.tag)
+                    continue
+                parents.pop()
+                depth = len(path) - 1
+                if waiting and path[1:] == header_path:
+                    header = element
+                    waiting = False
+                    yield header
+                    yield from pending
+                    pending = []
+                elif path[1:] == body_path:
+                    if waiting:
+                        pending.append(element)
                     else:
-                        row_data.append(f'"{str(el_text).replace('"', '""')}"')
-                fout.write(','.join(row_data) + '\n')
+                        yield element
+                path.pop()
+                # 処理済みの要素を解放(Body部までの経路上の要素のみ、それ以外は親要素とともに解放)
+                if 1 <= depth <= len(body_path) and path[1:] == body_path[:depth - 1]:
+                    parents[-1].remove(element)
+        if waiting:
+            raise ValueError(f"header not found: {key_header}")
+
+    def _build_columns(self, header:Et.Element, tickets, dtypes:dict, as_frame:bool, offset:int):
+        """Body部の要素から列単位のデータを作成
+
+        Args:
+            header (Et.Element): Header部のElement
+            tickets (iterable): Body部のElement
+            dtypes (dict): 列名 -> 型
+            as_frame (bool): True=DataFrame, False=列名 -> np.ndarrayの辞書
+            offset (int): DataFrameのインデックスの開始番号
+        Returns:
+            pd.DataFrame | dict: 列単位のデータ
+        """
+        names = [column.attrib["name"] for column in header]
+        tags = [column.tag for column in header]
+        values = [[] for _ in tags]
+        for ticket in tickets:
+            texts = {child.tag: child.text for child in reversed(ticket)}
+            for column, tag in zip(values, tags):
+                text = texts.get(tag)
+                column.append(None if text is None or str(text) == "None" else text)
+
+        dtypes = dtypes or {}
+        columns = {name: self._convert_column(column, dtypes.get(name)) for name, column in zip(names, values)}
+        if not as_frame:
+            return columns
+        return pd.DataFrame(columns, index=pd.RangeIndex(offset, offset + len(values[0]) if values else offset))
+
+    def _convert_column(self, values:list, dtype) -> np.ndarray:
+        """列の型変換
+
+        Args:
+            values (list): 値(文字列、値なしはNone)
+            dtype: 変換後の型(Noneの場合は文字列(object))
+        Returns:
+            np.ndarray: 変換後の値(値なしは日付がNaT、浮動小数点数がnan、boolがFalse)
+        """
+        if dtype is None:
+            return np.array(values, dtype=object)
+        dtype = np.dtype(dtype)
+        if dtype.kind == 'M':
+            return pd.to_datetime(pd.Series(values, dtype=object), format='ISO8601').to_numpy().astype(dtype)
+        if dtype.kind == 'f':
+            return np.array([np.nan if value is None else value for value in values], dtype=dtype)
+        if dtype.kind == 'b':
+            return np.array([value is not None and str(value).strip().lower() in ('true', '1', 'yes') for value in values], dtype=dtype)
+        return np.array(values, dtype=dtype)
+
+    def _get_writer(self) -> CommonXMLBackgroundWriter:
+        """非同期書き込み用の書き込みスレッド取得(未作成の場合は作成)
+
+        Returns:
+            CommonXMLBackgroundWriter: 書き込みスレッド
+        """
+        if self._writer is None:
+            self._writer = CommonXMLBackgroundWriter(self.ASYNC_QUEUE_SIZE)
+        return self._writer
+
+    def _get_compression(self, file_path:str, compression:str) -> str:
+        """圧縮形式の判定
+
+        Args:
+            file_path (str): ファイル名
+            compression (str): 圧縮形式("infer"の場合は拡張子で判定)
+        Returns:
+            str: 圧縮形式(非圧縮の場合はNone)
+        """
+        if compression == 'infer':
+            return self.COMPRESSION_EXTENSIONS.get(os.path.splitext(str(file_path))[1].lower())
+        return compression
+
+    def _split_ext(self, file_path:str) -> tuple:
+        """ファイル名を拡張子(圧縮形式の拡張子を含む)とそれ以外に分割
+
+        Args:
+            file_path (str): ファイル名
+        Returns:
+            tuple: (拡張子以外, 拡張子) 例: "a.csv.gz" -> ("a", ".csv.gz")
+        """
+        base, ext = os.path.splitext(file_path)
+        if ext.lower() in self.COMPRESSION_EXTENSIONS:
+            base, inner = os.path.splitext(base)
+            ext = inner + ext
+        return base, ext
+
+    def _split_path(self, key:str) -> list:
+        """rootからのパスをタグのリストに分割
+
+        Args:
+            key (str): rootからのパス(例: "issue", "./issues/issue")
+        Returns:
+            list: タグのリスト
+        """
+        return [tag for tag in key.split('/') if tag not in ('', '.')]
+
+    def _write_csv_rows(self, fout, tickets, tags:list) -> int:
+        """CSV行の書き込み(バッチ単位でまとめて書き込む)
+
+        Args:
+            fout: 出力先
+            tickets (iterable): Body部のElement
+            tags (list): ヘッダーの列順のタグ
+        Returns:
+            int: 書き込んだ行数
+        """
+        count = 0
+        lines = []
+        for ticket in tickets:
+            lines.append(self._csv_line(ticket, tags))
+            if len(lines) >= self.CSV_BATCH_SIZE:
+                fout.write(''.join(lines))
+                count += len(lines)
+                lines = []
+        fout.write(''.join(lines))
+        return count + len(lines)
+
+    def _csv_line(self, ticket:Et.Element, tags:list) -> str:
+        """チケット1件分のCSV行の作成
+
+        子要素をタグで1回だけ索引付けし、ヘッダーの列順に並べる。
+        同じタグの子要素が複数ある場合は先頭の要素を使う(find()と同じ)。
+
+        Args:
+            ticket (Et.Element): Body部のElement
+            tags (list): ヘッダーの列順のタグ
+        Returns:
+            str: CSV行(改行付き、値なしは空文字、それ以外はダブルクォートで囲む)
+        """
+        texts = {child.tag: child.text for child in reversed(ticket)}
+        row_data = []
+        for tag in tags:
+            el_text = texts.get(tag)
+            if el_text is None or str(el_text) == "None":
+                row_data.append('')
+            else:
+                row_data.append('"' + str(el_text).replace('"', '""') + '"')
+        return ','.join(row_data) + '\n'
+
+    def iter_records(self, infile_path:str, key_body:str, compression:str = 'infer'):
+        """XMLファイルからBody部のレコードを逐次取得
+
+        iterparseで読み込み、処理済みの要素は解放するため、
+        ファイルサイズによらずメモリ使用量は一定となる。
+
+        Args:
+            infile_path (str): 読込ファイル名
+            key_body (str): Body部のname(rootからのパス、save_csv()と同じ)
+            compression (str): 読込ファイルの圧縮形式(open_file()と同じ)
+        Yields:
+            dict: 子要素のタグ -> テキスト
+        """
+        for element in self._iter_elements(infile_path, None, key_body, compression):
+            yield {child.tag: child.text for child in element}